@@ -872,6 +872,9 @@ class ChessGame:
         # Clear the screen
         self.screen.fill(COLOR_BACKGROUND)
         
+        # Poll the mouse once for every draw call this frame
+        self.ui.begin_frame()
+        
         # Draw based on game mode
         if self.show_mode_selection:
             self.render_mode_selection()  # Render game mode selection screen
@@ -904,8 +907,11 @@ class ChessGame:
         elif self.game_mode == GAME_MODE_SETTINGS:
             self.render_settings()
         
-        # Update display
-        pygame.display.flip()
+        # Update display - only the changed regions when the UI reports them
+        if self.ui.dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.ui.dirty_rects)
 
     def render_mode_selection(self) -> None:
         """Render the game mode selection screen."""
@@ -938,10 +944,7 @@ class ChessGame:
 
     def render_game(self) -> None:
         """Render the chessboard and in-game UI."""
-        # First draw the theme background
-        self.ui.draw_theme_background(self.screen, self.settings.get_theme())
-        
-        # Use the updated draw_game method with theme support
+        # draw_game paints the theme background as part of its cached board layer
         self.ui.draw_game(
             self.screen,
             self.board,
@@ -9,6 +9,7 @@ Required Features:
 import chess
 import chess.pgn
 import time
+from array import array
 from typing import List, Optional, Tuple, Dict
 
 class GameBoard:
@@ -31,6 +32,15 @@ class GameBoard:
             chess.BLACK: []
         }
         
+        # The same captured pieces packed as piece_type | (color << 3), one byte each
+        self.captured_codes: Dict[bool, array] = {
+            chess.WHITE: array('B'),
+            chess.BLACK: array('B')
+        }
+        
+        # Lazily built view of the captured lists, keyed by the side that lost them
+        self._all_captured: Optional[Dict[str, List[chess.Piece]]] = None
+        
         # Game state
         self.result = None
         self.result_reason = None
@@ -65,6 +75,8 @@ class GameBoard:
                 if captured_piece:
                     # Add to the appropriate captured list
                     self.captured_pieces[not captured_piece.color].append(captured_piece)
+                    self.captured_codes[not captured_piece.color].append(
+                        captured_piece.piece_type | (captured_piece.color << 3))
             
             # Make the move
             self.board.push(move)
@@ -94,6 +106,7 @@ class GameBoard:
             # If the last move was a capture, remove it from captured list
             if self.captured_pieces[self.board.turn]:
                 self.captured_pieces[self.board.turn].pop()
+                self.captured_codes[self.board.turn].pop()
         
         # Undo the move on the board
         self.board.pop()
@@ -135,17 +148,34 @@ class GameBoard:
         """
         return self.captured_pieces[color]
     
+    def get_captured_codes(self, color: bool) -> array:
+        """
+        Get the pieces captured by the specified color as packed piece codes
+        
+        Args:
+            color: Color whose captured pieces to return (True for white, False for black)
+            
+        Returns:
+            Byte array of piece_type | (piece color << 3) codes, in capture order
+        """
+        return self.captured_codes[color]
+    
     def get_all_captured_pieces(self) -> Dict:
         """
         Get captured pieces for both sides
         
+        Each list only ever holds pieces of its key's color, so callers need not filter.
+        
         Returns:
             Dictionary with captured pieces for white and black
         """
-        return {
-            'white': self.captured_pieces[chess.BLACK],
-            'black': self.captured_pieces[chess.WHITE]
-        }
+        # The dictionary shares the captured lists, so it stays valid until they are replaced
+        if self._all_captured is None:
+            self._all_captured = {
+                'white': self.captured_pieces[chess.BLACK],
+                'black': self.captured_pieces[chess.WHITE]
+            }
+        return self._all_captured
     
     def is_promotion_move(self, move: chess.Move) -> bool:
         """
@@ -276,6 +306,8 @@ class GameBoard:
             self.board = chess.Board(fen)
             self.move_history = []
             self.captured_pieces = {chess.WHITE: [], chess.BLACK: []}
+            self.captured_codes = {chess.WHITE: array('B'), chess.BLACK: array('B')}
+            self._all_captured = None
             if hasattr(self, 'move_times'):
                 self.move_times = []
             if hasattr(self, 'last_move_time'):
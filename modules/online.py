@@ -31,6 +31,9 @@ class ChessClient:
             "move_made": [],
             "game_over": [],
             "opponent_resigned": [],
+            "opponent_disconnected": [],
+            "opponent_reconnected": [],
+            "reconnected": [],
             "chat_message": [],
             "game_state": [],
             "error": [],
@@ -70,7 +73,9 @@ class ChessClient:
     async def _connect_and_process(self, player_name: str):
         """Connect to WebSocket server and process messages"""
         try:
-            async with websockets.connect(self.server_url) as websocket:
+            # Send back the ID from an earlier connection so the server can resume our game
+            headers = {"Player-ID": self.player_id} if self.player_id else None
+            async with websockets.connect(self.server_url, additional_headers=headers) as websocket:
                 self.websocket = websocket
                 self.connected = True
                 self._trigger_event("connection_established", {"player_name": player_name})
@@ -117,6 +122,13 @@ class ChessClient:
         if message_type == "connection_established":
             self.player_id = data.get("player_id")
             
+        elif message_type == "reconnected":
+            self.player_id = data.get("player_id")
+            self.game_state = data.get("game_state")
+            if self.game_state is None:
+                self.game_id = None
+                self.player_color = None
+            
         elif message_type == "game_start":
             self.game_id = data.get("game_id")
             self.player_color = chess.WHITE if data.get("your_color") == "white" else chess.BLACK
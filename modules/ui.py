@@ -7,7 +7,7 @@ import pygame
 import chess
 import os
 import math
-from typing import List, Dict, Tuple, Optional, Any, Union
+from typing import List, Dict, Tuple, Optional, Any, Union, NamedTuple
 import time
 
 # Import config settings
@@ -56,6 +56,33 @@ FONT_SIZE_LARGE = 32
 FONT_SIZE_MEDIUM = 24
 FONT_SIZE_SMALL = 18
 
+# Maximum number of rendered text surfaces kept in the text cache
+TEXT_CACHE_SIZE = 256
+
+# Number of rendered chess clock readouts kept (two clocks, two colors each)
+CLOCK_CACHE_SIZE = 4
+
+# Promotion menu options, left to right
+PROMOTION_PIECE_TYPES = (chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT)
+
+# Largest offset of the glow copies drawn around overlay text
+GLOW_OFFSET = 3
+
+# Frames between text cache sweeps; entries unused for this long are dropped
+TEXT_CACHE_SWEEP_FRAMES = 600
+
+# Size of one square in the settings screen theme previews
+THEME_PREVIEW_SIZE = 20
+
+# Characters that can appear in a move history line (move numbers and UCI moves)
+MOVE_HISTORY_CHARSET = "0123456789abcdefghnqr .KQRBNPx-="
+
+class CachedText(NamedTuple):
+    """Rendered text surface stored with its size"""
+    surface: pygame.Surface
+    width: int
+    height: int
+
 class Button:
     """Button class for UI elements"""
     
@@ -78,6 +105,9 @@ class Button:
         self.hover_color = COLOR_BUTTON_HOVER
         self.text_color = COLOR_TEXT
         self.hover = False
+        
+        # Rendered label, re-created only after the text changes
+        self._text_surface: Optional[pygame.Surface] = None
     
     def update_text(self, text: str) -> None:
         """
@@ -86,7 +116,20 @@ class Button:
         Args:
             text: New button text
         """
+        if text != self.text:
+            self.text = text
+            self._text_surface = None
+    
+    def set_label(self, text: str, text_surface: pygame.Surface) -> None:
+        """
+        Set the button text together with an already rendered label
+        
+        Args:
+            text: New button text
+            text_surface: Label surface rendered from text
+        """
         self.text = text
+        self._text_surface = text_surface
     
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -103,10 +146,11 @@ class Button:
         # Draw button border
         pygame.draw.rect(surface, (50, 50, 50), self.rect, 2)
         
-        # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        # Draw text, rendering the label only when it is new or changed
+        if self._text_surface is None:
+            self._text_surface = self.font.render(self.text, True, self.text_color).convert_alpha()
+        text_rect = self._text_surface.get_rect(center=self.rect.center)
+        surface.blit(self._text_surface, text_rect)
     
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """
@@ -152,9 +196,17 @@ class Animation:
         self.start_pos = self.ui.square_to_coords(move.from_square)
         self.end_pos = self.ui.square_to_coords(move.to_square)
     
-    def update(self) -> float:
-        """Update animation progress"""
-        elapsed = time.time() - self.start_time
+    def update(self, now: Optional[float] = None) -> float:
+        """
+        Update animation progress
+        
+        Args:
+            now: Current time, so several animations can share one clock reading
+            
+        Returns:
+            Progress between 0.0 and 1.0
+        """
+        elapsed = (time.time() if now is None else now) - self.start_time
         self.progress = min(1.0, elapsed / self.duration)
         return self.progress
     
@@ -191,17 +243,154 @@ class ChessUI:
         # Load piece images
         self.piece_images = self.load_pieces()
         
+        # Half-size piece images for the captured pieces display
+        self.piece_images_small = {
+            key: pygame.transform.smoothscale(img, (SQUARE_SIZE // 2, SQUARE_SIZE // 2))
+            for key, img in self.piece_images.items()
+        }
+        
+        # 30px piece images for the local multiplayer captured pieces display
+        self._piece_images_30 = {
+            key: pygame.transform.scale(img, (30, 30))
+            for key, img in self.piece_images.items()
+        }
+        
+        # Same 30px images keyed by piece_type | (color << 3), so captured pieces skip symbol lookups
+        self._piece_img_by_code: Dict[int, pygame.Surface] = {}
+        for symbol, img in self._piece_images_30.items():
+            piece = chess.Piece.from_symbol(symbol)
+            self._piece_img_by_code[piece.piece_type | (piece.color << 3)] = img
+        
+        # Offsets of the 8-wide local multiplayer captured grid (30px pieces, 5px spacing)
+        self._cap_offsets: List[Tuple[int, int]] = [((i % 8) * 35, (i // 8) * 35) for i in range(64)]
+        
+        # Captured label positions and the absolute cell positions of each grid, 20px below its label
+        self._cap_label_pos = ((BOARD_OFFSET_X + BOARD_SIZE + 20, 200), (BOARD_OFFSET_X + BOARD_SIZE + 20, 300))
+        self._cap_positions = tuple(
+            [(label_x + ox, label_y + 20 + oy) for ox, oy in self._cap_offsets]
+            for label_x, label_y in self._cap_label_pos
+        )
+        
         # Load background images
         self.background_images = self.load_backgrounds()
         
+        # Load time constraint icons
+        self._time_icons = self.load_time_icons()
+        
         # Piece animations
         self.animations: List[Animation] = []
         
+        # Rendered text surfaces keyed by (font id, text, color)
+        self._text_cache: Dict[Tuple[int, str, tuple], CachedText] = {}
+        
+        # Frame counter and the last frame each cached text was drawn on
+        self._frame_count = 0
+        self._text_cache_last_used: Dict[Tuple[int, str, tuple], int] = {}
+        
+        # Rendered clock readouts keyed by (time string, color), last few only
+        self._clock_cache: Dict[Tuple[str, tuple], pygame.Surface] = {}
+        
+        # Hint count currently shown on the hint button
+        self._hint_button_last_count = -1
+        
+        # Mouse position polled once per frame by begin_frame()
+        self._mouse_pos: Tuple[int, int] = (0, 0)
+        
+        # Screen regions changed this frame, or None when the whole window must be updated
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+        self._frame_was_game = False
+        self._prev_frame_was_game = False
+        
+        # Cached game screen layers and the state they were rendered for
+        self._board_layer: Optional[pygame.Surface] = None
+        self._board_layer_key = None
+        self._sidebar_layer: Optional[pygame.Surface] = None
+        self._sidebar_key = None
+        self._game_overlay_key = None
+        
+        # Last drawn local multiplayer frame and the state it was drawn for
+        self._local_mp_frame: Optional[pygame.Surface] = None
+        self._local_mp_state_key = None
+        self._frame_was_local_mp = False
+        self._prev_frame_was_local_mp = False
+        
+        # Pre-rendered static screen chrome and the state it was rendered for
+        self._settings_chrome: Optional[pygame.Surface] = None
+        self._settings_chrome_key = None
+        self._player_vs_ai_chrome: Optional[pygame.Surface] = None
+        self._player_vs_ai_chrome_key = None
+        self._rating_rect: Optional[pygame.Rect] = None
+        
         # Create font objects
         self.large_font = pygame.font.SysFont("Arial", FONT_SIZE_LARGE)
         self.medium_font = pygame.font.SysFont("Arial", FONT_SIZE_MEDIUM)
         self.small_font = pygame.font.SysFont("Arial", FONT_SIZE_SMALL)
-        self.huge_font = pygame.font.SysFont("Arial", 48)  # For checkmate/win overlays
+        self.huge_font = pygame.font.SysFont("Arial", 60)  # For checkmate/win overlays
+        self._font_clock_bold = pygame.font.SysFont("Arial", FONT_SIZE_MEDIUM, bold=True)  # For chess clocks
+        
+        # Local multiplayer turn indicators, one per side
+        self._turn_surfaces = {
+            chess.WHITE: self.medium_font.render("White's Turn", True, COLOR_TEXT).convert_alpha(),
+            chess.BLACK: self.medium_font.render("Black's Turn", True, COLOR_TEXT).convert_alpha()
+        }
+        
+        # Local multiplayer captured pieces labels
+        self._cap_labels = (
+            self.small_font.render("Captured by White", True, COLOR_TEXT).convert_alpha(),
+            self.small_font.render("Captured by Black", True, COLOR_TEXT).convert_alpha()
+        )
+        
+        # Glyph atlas for the move history, so lines are assembled from cached characters
+        self._glyph_surfs: Dict[str, pygame.Surface] = {}
+        self._glyph_widths: Dict[str, int] = {}
+        for ch in MOVE_HISTORY_CHARSET:
+            glyph = self.small_font.render(ch, True, COLOR_TEXT).convert_alpha()
+            self._glyph_surfs[ch] = glyph
+            self._glyph_widths[ch] = glyph.get_width()
+        
+        # Composed move history lines, one (move, surface) entry per move index
+        self._move_history_cache: List[Optional[Tuple[chess.Move, pygame.Surface]]] = []
+        
+        # Full-window dimming overlays for the checkmate and result screens
+        self._overlay_dim_128 = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._overlay_dim_128.fill((0, 0, 0, 128))
+        self._overlay_dim_180 = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._overlay_dim_180.fill((0, 0, 0, 180))
+        
+        # WIN/LOSE overlay background, created on first use
+        self._result_overlay: Optional[pygame.Surface] = None
+        
+        # Selected square highlight
+        self._selected_highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
+        self._selected_highlight.fill(COLOR_SELECTED)
+        
+        # Translucent message backgrounds keyed by their (width, height)
+        self._msg_overlay_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        
+        # Pre-composed glow sprites keyed by (text, font id, color)
+        self._glow_cache: Dict[Tuple[str, int, tuple], pygame.Surface] = {}
+        
+        # Pre-rendered CHECKMATE text and its glow (letters spaced out for more visual impact)
+        spaced_text = "C    H    E    C    K    M    A    T    E"
+        self._checkmate_text_surf = self.huge_font.render(spaced_text, True, (255, 50, 50)).convert_alpha()
+        self._checkmate_glow_sprite = self._make_glow_sprite(spaced_text, self.huge_font, (200, 50, 50, 128))
+        
+        # Promotion menu, centered in the window, and one button rect per option
+        menu_width = 300
+        menu_height = 100
+        self._promotion_menu_rect = pygame.Rect((WINDOW_WIDTH - menu_width) // 2,
+                                                (WINDOW_HEIGHT - menu_height) // 2,
+                                                menu_width, menu_height)
+        promotion_button_width = menu_width // len(PROMOTION_PIECE_TYPES)
+        self._promotion_rects: List[pygame.Rect] = [
+            pygame.Rect(self._promotion_menu_rect.x + i * promotion_button_width, self._promotion_menu_rect.y,
+                        promotion_button_width, menu_height)
+            for i in range(len(PROMOTION_PIECE_TYPES))
+        ]
+        
+        # Main menu title and its centered position
+        self._menu_title = self._render(self.large_font, "Chess AI", COLOR_TEXT)
+        self._menu_title_pos = (WINDOW_WIDTH // 2 - self._menu_title.get_width() // 2, 100)
         
         # Calculate button positions
         center_x = WINDOW_WIDTH // 2
@@ -341,6 +530,62 @@ class ChessUI:
             "3 Hints"
         )
         
+        # Time constraint buttons for local multiplayer
+        time_button_width = 300
+        time_button_height = 60
+        time_button_x = center_x - time_button_width // 2
+        time_button_step = time_button_height + 20
+        self.bullet_button = Button(
+            time_button_x,
+            120,
+            time_button_width,
+            time_button_height,
+            "Bullet Chess - 1 min"
+        )
+        
+        self.blitz_3_button = Button(
+            time_button_x,
+            120 + time_button_step,
+            time_button_width,
+            time_button_height,
+            "Blitz Chess - 3 min"
+        )
+        
+        self.blitz_5_button = Button(
+            time_button_x,
+            120 + time_button_step * 2,
+            time_button_width,
+            time_button_height,
+            "Blitz Chess - 5 min"
+        )
+        
+        self.rapid_button = Button(
+            time_button_x,
+            120 + time_button_step * 3,
+            time_button_width,
+            time_button_height,
+            "Rapid Chess - 10 min"
+        )
+        
+        self.no_time_button = Button(
+            time_button_x,
+            120 + time_button_step * 4,
+            time_button_width,
+            time_button_height,
+            "No Time Constraint"
+        )
+        
+        self._time_buttons = (self.bullet_button, self.blitz_3_button, self.blitz_5_button,
+                              self.rapid_button, self.no_time_button)
+        
+        # Icon blits next to the time constraint buttons (only for icons that loaded)
+        time_icon_keys = ("bullet", "blitz", "blitz", "rapid", "no_time")
+        self._time_icon_blits = [
+            (self._time_icons[key], (button.rect.x - 50, button.rect.centery - 20))
+            for key, button in zip(time_icon_keys, self._time_buttons)
+            if key in self._time_icons
+        ]
+        
         # In-game hint button
         self.hint_button = Button(
             BOARD_OFFSET_X + BOARD_SIZE + 20,
@@ -367,15 +612,32 @@ class ChessUI:
         for i, theme in enumerate(theme_names):
             self.theme_buttons[theme] = Button(
                 center_x - button_width // 2,
-                150 + (button_height + 10) * i,
+                140 + (button_height + 10) * i,
                 button_width,
                 button_height,
                 theme.capitalize()
             )
         
+        # The settings layout below the theme list hangs off its last button
+        self._last_theme_button = next(reversed(self.theme_buttons.values()))
+        
+        # Pre-render the mini-board preview (2x2 squares) of each theme
+        from modules.settings import THEMES
+        self._theme_previews: Dict[str, pygame.Surface] = {}
+        for theme_name, theme_colors in THEMES.items():
+            preview = pygame.Surface((2 * THEME_PREVIEW_SIZE, 2 * THEME_PREVIEW_SIZE)).convert()
+            for i in range(2):
+                for j in range(2):
+                    is_light = (i + j) % 2 != 0
+                    color = theme_colors["light_square"] if is_light else theme_colors["dark_square"]
+                    pygame.draw.rect(preview, color, 
+                                    (i * THEME_PREVIEW_SIZE, j * THEME_PREVIEW_SIZE, 
+                                     THEME_PREVIEW_SIZE, THEME_PREVIEW_SIZE))
+            self._theme_previews[theme_name] = preview
+        
         self.music_toggle_button = Button(
             center_x - button_width // 2,
-            150 + (button_height + 10) * len(theme_names),
+            self._last_theme_button.rect.bottom + 20,
             button_width,
             button_height,
             "Music: On"
@@ -451,7 +713,7 @@ class ChessUI:
             for symbol, file_path in piece_files.items():
                 if os.path.exists(file_path):
                     # Load and scale image to fit square
-                    img = pygame.image.load(file_path)
+                    img = pygame.image.load(file_path).convert_alpha()
                     pieces[symbol] = pygame.transform.scale(
                         img, (SQUARE_SIZE - 10, SQUARE_SIZE - 10)
                     )
@@ -469,8 +731,8 @@ class ChessUI:
         
         for theme, path in BACKGROUND_IMAGES.items():
             try:
-                # Load and scale the background to fit the window
-                background = pygame.image.load(path)
+                # Load and scale the background to fit the window, in the display's pixel format
+                background = pygame.image.load(path).convert()
                 background = pygame.transform.scale(background, (WINDOW_WIDTH, WINDOW_HEIGHT))
                 backgrounds[theme] = background
                 print(f"Loaded background for theme: {theme}")
@@ -480,6 +742,118 @@ class ChessUI:
         
         return backgrounds
     
+    def load_time_icons(self) -> Dict[str, pygame.Surface]:
+        """Load the time constraint icons, pre-scaled for the selection screen"""
+        icons = {}
+        icons_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "time_limit")
+        icon_paths = {
+            "bullet": os.path.join(icons_dir, "bullet_chess.png"),
+            "blitz": os.path.join(icons_dir, "blitz_chess.png"),
+            "rapid": os.path.join(icons_dir, "rapid_chess.png"),
+            "no_time": os.path.join(icons_dir, "no_time_constraint.png")
+        }
+        
+        for key, path in icon_paths.items():
+            if os.path.exists(path):
+                icon = pygame.image.load(path).convert_alpha()
+                icons[key] = pygame.transform.scale(icon, (40, 40))
+            else:
+                print(f"Warning: Icon {path} not found")
+        
+        return icons
+    
+    def begin_frame(self) -> None:
+        """Poll per-frame input state shared by all draw methods"""
+        self._mouse_pos = pygame.mouse.get_pos()
+        
+        # Assume a full window update unless a draw method narrows it down
+        self.dirty_rects = None
+        self._prev_frame_was_game = self._frame_was_game
+        self._frame_was_game = False
+        self._prev_frame_was_local_mp = self._frame_was_local_mp
+        self._frame_was_local_mp = False
+        
+        # Periodically drop cached text that has not been drawn recently
+        self._frame_count += 1
+        if self._frame_count % TEXT_CACHE_SWEEP_FRAMES == 0:
+            self._sweep_text_cache()
+    
+    def _sweep_text_cache(self) -> None:
+        """Drop text cache entries not drawn since the previous sweep"""
+        cutoff = self._frame_count - TEXT_CACHE_SWEEP_FRAMES
+        stale = [key for key, frame in self._text_cache_last_used.items() if frame < cutoff]
+        for key in stale:
+            del self._text_cache[key]
+            del self._text_cache_last_used[key]
+    
+    def _blit_batch(self, surface: pygame.Surface, blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+        """
+        Blit a sequence of (surface, position) pairs in a single call
+        
+        Args:
+            surface: Surface to draw on
+            blit_seq: Surfaces and the positions to blit them at
+        """
+        # pygame-ce's fblits skips building the list of changed rects; stock pygame uses blits
+        fblits = getattr(surface, 'fblits', None)
+        if fblits is not None:
+            fblits(blit_seq)
+        else:
+            surface.blits(blit_seq, doreturn=False)
+    
+    def _update_hover(self, buttons: Tuple[Button, ...], mouse_pos: Tuple[int, int]) -> None:
+        """
+        Update the hover state of a group of buttons with one hit test
+        
+        Args:
+            buttons: Buttons to update
+            mouse_pos: Current mouse position
+        """
+        # A 1x1 rect at the cursor collides exactly where collidepoint would
+        hit = pygame.Rect(mouse_pos, (1, 1)).collidelist([btn.rect for btn in buttons])
+        for i, btn in enumerate(buttons):
+            btn.hover = i == hit
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> CachedText:
+        """
+        Render text through the text cache, keeping its size alongside
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+        
+        Returns:
+            Cached text surface with its width and height
+        """
+        key = (id(font), text, color)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            text_surface = font.render(text, True, color).convert_alpha()
+            cached = CachedText(text_surface, text_surface.get_width(), text_surface.get_height())
+            # Drop the oldest entry once the cache is full
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                oldest = next(iter(self._text_cache))
+                del self._text_cache[oldest]
+                del self._text_cache_last_used[oldest]
+            self._text_cache[key] = cached
+        self._text_cache_last_used[key] = self._frame_count
+        return cached
+    
+    def _render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render text through the text cache
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+        
+        Returns:
+            Cached text surface
+        """
+        return self._render_text(font, text, color).surface
+    
     def square_coords_to_pos(self, coords: Tuple[int, int]) -> Tuple[int, int]:
         """
         Convert square coordinates (file, rank) to screen position
@@ -616,7 +990,8 @@ class ChessUI:
         self.draw_pieces(surface, board_state)
         
         # Draw animated pieces
-        self.draw_animated_pieces(surface, board_state)
+        if self.animations:
+            self.draw_animated_pieces(surface, board_state)
         
         # Draw board border
         pygame.draw.rect(surface, COLOR_LIGHT_GRAY, board_rect, 3)
@@ -666,40 +1041,39 @@ class ChessUI:
         if not board_state or not hasattr(board_state, 'board'):
             return
         
-        # Get the board representation
-        board = board_state.board
+        # Pieces on these squares are drawn by draw_animated_pieces instead
+        animating = {anim.move.from_square for anim in self.animations}
         
-        # Mapping from python-chess piece symbols to our notation
-        piece_map = {
-            'P': 'P', 'N': 'N', 'B': 'B', 'R': 'R', 'Q': 'Q', 'K': 'K',
-            'p': 'p', 'n': 'n', 'b': 'b', 'r': 'r', 'q': 'q', 'k': 'k'
-        }
+        # Visible area - blits outside of it are skipped
+        clip_rect = surface.get_clip()
+        
+        # Bind per-piece lookups to locals once
+        piece_images = self.piece_images
+        square_to_coords = self.square_to_coords
+        half_square = SQUARE_SIZE // 2
+        
+        # Resting pieces are collected here and blitted in one call
+        blit_list = []
         
-        # Draw each piece
-        for square in chess.SQUARES:
-            # Skip if this square is being animated
-            if self.is_piece_animating(square):
+        # Draw each piece - piece_map() only visits occupied squares
+        for square, piece in board_state.board.piece_map().items():
+            if square in animating:
                 continue
             
-            piece = board.piece_at(square)
-            if piece:
-                # Get piece symbol and convert to our notation
-                symbol = piece.symbol()
-                
-                # Direct mapping - this solves the piece color issue
-                if symbol in piece_map:
-                    key = piece_map[symbol]
-                    
-                    if key in self.piece_images:
-                        # Calculate position
-                        pos = self.square_to_coords(square)
-                        
-                        # Center the piece on the square
-                        img = self.piece_images[key]
-                        img_rect = img.get_rect(center=(pos[0] + SQUARE_SIZE // 2, pos[1] + SQUARE_SIZE // 2))
-                        surface.blit(img, img_rect)
-                    else:
-                        print(f"Warning: Missing piece image for {key}")
+            # python-chess symbols are used directly as image keys
+            key = piece.symbol()
+            img = piece_images.get(key)
+            if img is None:
+                print(f"Warning: Missing piece image for {key}")
+                continue
+            
+            # Center the piece on the square
+            x, y = square_to_coords(square)
+            img_rect = img.get_rect(center=(x + half_square, y + half_square))
+            if clip_rect.colliderect(img_rect):
+                blit_list.append((img, img_rect))
+        
+        surface.blits(blit_list, doreturn=False)
     
     def is_piece_animating(self, square: chess.Square) -> bool:
         """Check if a piece on a square is currently being animated"""
@@ -714,11 +1088,11 @@ class ChessUI:
         if not self.animations:
             return
         
-        # Mapping from python-chess piece symbols to our notation
-        piece_map = {
-            'P': 'P', 'N': 'N', 'B': 'B', 'R': 'R', 'Q': 'Q', 'K': 'K',
-            'p': 'p', 'n': 'n', 'b': 'b', 'r': 'r', 'q': 'q', 'k': 'k'
-        }
+        # Visible area - blits outside of it are skipped
+        clip_rect = surface.get_clip()
+        
+        # Moving pieces are collected here and blitted in one call
+        blit_list = []
         
         # Draw each animated piece
         for anim in self.animations:
@@ -727,9 +1101,8 @@ class ChessUI:
             piece = anim.board.piece_at(from_square)
             
             if piece:
-                # Get piece symbol and convert to our notation
-                symbol = piece.symbol()
-                key = piece_map.get(symbol)
+                # python-chess symbols are used directly as image keys
+                key = piece.symbol()
                 
                 if key in self.piece_images:
                     # Get current position from the animation
@@ -738,9 +1111,12 @@ class ChessUI:
                     # Center the piece on the current position
                     img = self.piece_images[key]
                     img_rect = img.get_rect(center=(x, y))
-                    surface.blit(img, img_rect)
+                    if clip_rect.colliderect(img_rect):
+                        blit_list.append((img, img_rect))
                 else:
                     print(f"Warning: Missing animated piece image for {key}")
+        
+        surface.blits(blit_list, doreturn=False)
     
     def highlight_legal_moves(self, surface: pygame.Surface, board_state: chess.Board, selected_square: chess.Square) -> None:
         """
@@ -784,10 +1160,8 @@ class ChessUI:
             x, y = self.square_to_coords(selected_square)
             selected_rect = pygame.Rect(x, y, SQUARE_SIZE, SQUARE_SIZE)
             
-            # Create semi-transparent highlight
-            highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-            highlight.fill(COLOR_SELECTED)
-            surface.blit(highlight, selected_rect)
+            # Draw semi-transparent highlight
+            surface.blit(self._selected_highlight, selected_rect)
         
         # Draw legal move indicators (circles)
         for square in highlighted_squares:
@@ -815,12 +1189,13 @@ class ChessUI:
     
     def update_animations(self) -> bool:
         """updates ongoing animations and removes completed ones."""
-        # Update progress for all animations
-        for anim in self.animations:
-            anim.update()
+        # Nothing to advance
+        if not self.animations:
+            return False
         
-        # Remove completed animations
-        self.animations = [anim for anim in self.animations if not anim.is_complete()]
+        # Advance all animations against one clock reading and keep the unfinished ones
+        now = time.time()
+        self.animations = [anim for anim in self.animations if anim.update(now) < 1.0]
         
         # Return whether there are still animations in progress
         return len(self.animations) > 0
@@ -831,21 +1206,15 @@ class ChessUI:
         self.draw_theme_background(surface, current_theme)
         
         # Draw title
-        title = self.large_font.render("Chess AI", True, COLOR_TEXT)
-        surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 100))
-        
-        # Draw buttons
-        mouse_pos = pygame.mouse.get_pos()
-        self.new_game_button.update(mouse_pos)
-        self.new_game_button.draw(surface)
-        self.settings_button.update(mouse_pos)
-        self.settings_button.draw(surface)
-        self.quit_button.update(mouse_pos)
-        self.quit_button.draw(surface)
-        
-        # Draw universal back button
-        self.universal_back_button.update(mouse_pos)
-        self.universal_back_button.draw(surface)
+        surface.blit(self._menu_title, self._menu_title_pos)
+        
+        # Draw buttons, including the universal back button
+        mouse_pos = self._mouse_pos
+        buttons = (self.new_game_button, self.settings_button,
+                   self.quit_button, self.universal_back_button)
+        self._update_hover(buttons, mouse_pos)
+        for btn in buttons:
+            btn.draw(surface)
     
     def draw_game(self, surface: pygame.Surface, board_state: Any, 
                   selected_square: Optional[chess.Square], 
@@ -869,11 +1238,20 @@ class ChessUI:
             hint_move: Current hint move to highlight
             viewing_history: Whether viewing move history
         """
-        # Draw theme background
-        self.draw_theme_background(surface, current_theme)
-        
-        # Draw the chess board and pieces
-        self.draw_board(surface, board_state, current_theme=current_theme)
+        # Background, board and resting pieces only change when the position does
+        board_layer_key = (
+            current_theme,
+            board_state.board.board_fen(),
+            self.board_flipped,
+            tuple(anim.move.from_square for anim in self.animations)
+        )
+        layers_changed = board_layer_key != self._board_layer_key
+        if layers_changed:
+            self._board_layer = pygame.Surface(surface.get_size()).convert()
+            self.draw_theme_background(self._board_layer, current_theme)
+            self.draw_board(self._board_layer, board_state, current_theme=current_theme)
+            self._board_layer_key = board_layer_key
+        surface.blit(self._board_layer, (0, 0))
         
         # Draw highlighted squares for selection
         self.draw_highlights(
@@ -884,39 +1262,44 @@ class ChessUI:
         )
         
         # Draw animated pieces on top
-        self.draw_animated_pieces(surface, board_state)
+        if self.animations:
+            self.draw_animated_pieces(surface, board_state)
         
         # Draw game info
         turn_text = "Your Turn" if human_turn else "AI Thinking..."
-        turn_surface = self.medium_font.render(turn_text, True, COLOR_TEXT)
+        turn_surface, turn_width, turn_height = self._render_text(self.medium_font, turn_text, COLOR_TEXT)
         
         # Add a background behind the text for better visibility
         text_bg = pygame.Rect(
             BOARD_OFFSET_X + BOARD_SIZE + 20, 
             BOARD_OFFSET_Y,
-            turn_surface.get_width() + 10,
-            turn_surface.get_height() + 5
+            turn_width + 10,
+            turn_height + 5
         )
         pygame.draw.rect(surface, COLOR_BUTTON, text_bg)
         pygame.draw.rect(surface, (50, 50, 50), text_bg, 1)
         surface.blit(turn_surface, (BOARD_OFFSET_X + BOARD_SIZE + 25, BOARD_OFFSET_Y + 2))
         
         # Draw captured pieces
+        sidebar_key = self._sidebar_key
         self.draw_captured_pieces(surface, board_state)
+        layers_changed = layers_changed or self._sidebar_key != sidebar_key
         
         # Draw AI info if AI is thinking
         if ai_thinking:
             self.draw_thinking_indicator(surface, thinking_time)
         
         # Draw settings button in-game
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         self.in_game_settings_button.update(mouse_pos)
         self.in_game_settings_button.draw(surface)
         
         # Draw hint button and count if hints are available
         if hints_remaining > 0:
-            # Update hint button label to show remaining count
-            self.hint_button.update_text(f"Hint ({hints_remaining})")
+            # Update hint button label when the remaining count changes
+            if hints_remaining != self._hint_button_last_count:
+                self.hint_button.update_text(f"Hint ({hints_remaining})")
+                self._hint_button_last_count = hints_remaining
             self.hint_button.update(mouse_pos)
             self.hint_button.draw(surface)
         
@@ -924,113 +1307,105 @@ class ChessUI:
         # Draw move history
         self.draw_move_history(surface, board_state)
         
-        # Draw move history navigation buttons
-        self.move_back_button.update(mouse_pos)
-        self.move_back_button.draw(surface)
-        
-        self.move_forward_button.update(mouse_pos)
-        self.move_forward_button.draw(surface)
-        
-        # Draw universal back button
-        self.universal_back_button.update(mouse_pos)
-        self.universal_back_button.draw(surface)
+        # Draw move history navigation buttons and the universal back button
+        buttons = (self.move_back_button, self.move_forward_button,
+                   self.universal_back_button)
+        self._update_hover(buttons, mouse_pos)
+        for btn in buttons:
+            btn.draw(surface)
         
         # Draw viewing history message if in history mode
         if viewing_history:
-            history_msg = self.medium_font.render("Viewing History", True, (220, 150, 50))
+            history_msg = self._render(self.medium_font, "Viewing History", (220, 150, 50))
             msg_rect = history_msg.get_rect(center=(self.move_back_button.rect.left - 95, self.move_back_button.rect.centery))
             pygame.draw.rect(surface, (40, 40, 40), 
                              (msg_rect.left - 10, msg_rect.top - 5, 
                               msg_rect.width + 20, msg_rect.height + 10))
             surface.blit(history_msg, msg_rect)
+        
+        # With unchanged layers only the buttons, the thinking indicator and
+        # moving pieces can differ from the previous frame
+        overlay_key = (selected_square, tuple(highlighted_squares), hint_move,
+                       hints_remaining, viewing_history)
+        if not layers_changed and self._prev_frame_was_game and overlay_key == self._game_overlay_key:
+            self.dirty_rects = [
+                self.in_game_settings_button.rect,
+                self.hint_button.rect,
+                self.move_back_button.rect,
+                self.move_forward_button.rect,
+                self.universal_back_button.rect,
+                pygame.Rect(WINDOW_WIDTH - 180, WINDOW_HEIGHT - 50, 180, 50)
+            ]
+            if self.animations:
+                self.dirty_rects.append(pygame.Rect(BOARD_OFFSET_X, BOARD_OFFSET_Y, BOARD_SIZE, BOARD_SIZE))
+        self._game_overlay_key = overlay_key
+        self._frame_was_game = True
     
-    def draw_settings(self, surface: pygame.Surface, settings_manager, return_to_game: bool = False) -> None:
-        """draws the settings screen."""
+    def _build_settings_chrome(self, current_theme: str) -> pygame.Surface:
+        """
+        Render the static parts of the settings screen to an off-screen surface
+        
+        Args:
+            current_theme: Current theme name
+        
+        Returns:
+            Surface holding the background, labels and theme previews
+        """
+        chrome = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        
         # Draw background based on current theme
-        current_theme = settings_manager.get_theme()
-        self.draw_theme_background(surface, current_theme)
+        self.draw_theme_background(chrome, current_theme)
         
         # Draw title with background
-        title = self.large_font.render("Settings", True, COLOR_TEXT)
+        title = self._render(self.large_font, "Settings", COLOR_TEXT)
         title_width = title.get_width() + 20
         title_height = title.get_height() + 10
         title_x = WINDOW_WIDTH // 2 - title_width // 2
         title_y = 50
         
-        pygame.draw.rect(surface, COLOR_BUTTON, 
-                        (title_x, title_y, title_width, title_height))
-        pygame.draw.rect(surface, (50, 50, 50), 
-                        (title_x, title_y, title_width, title_height), 1)
-        
-        surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, title_y + 5))
-        
-        # Get mouse position for button updates
-        mouse_pos = pygame.mouse.get_pos()
-        
         # Draw theme label with background
-        theme_title = self.medium_font.render("Board Themes:", True, COLOR_TEXT)
+        theme_title = self._render(self.medium_font, "Board Themes:", COLOR_TEXT)
         theme_title_width = theme_title.get_width() + 20
         theme_title_height = theme_title.get_height() + 6
         theme_title_x = WINDOW_WIDTH // 2 - theme_title_width // 2
         theme_title_y = 100
         
-        pygame.draw.rect(surface, COLOR_BUTTON, 
-                        (theme_title_x, theme_title_y, theme_title_width, theme_title_height))
-        pygame.draw.rect(surface, (50, 50, 50), 
-                        (theme_title_x, theme_title_y, theme_title_width, theme_title_height), 1)
+        # Draw both label backgrounds, then blit both labels in one call
+        for rect in ((title_x, title_y, title_width, title_height),
+                     (theme_title_x, theme_title_y, theme_title_width, theme_title_height)):
+            pygame.draw.rect(chrome, COLOR_BUTTON, rect)
+            pygame.draw.rect(chrome, (50, 50, 50), rect, 1)
         
-        surface.blit(theme_title, (WINDOW_WIDTH // 2 - theme_title.get_width() // 2, theme_title_y + 3))
+        chrome.blits([
+            (title, (WINDOW_WIDTH // 2 - title.get_width() // 2, title_y + 5)),
+            (theme_title, (WINDOW_WIDTH // 2 - theme_title.get_width() // 2, theme_title_y + 3))
+        ], doreturn=False)
         
-        # Import THEMES here to avoid circular imports
-        from modules.settings import THEMES
+        # Add a small preview of each theme next to its button
+        for theme_name, button in self.theme_buttons.items():
+            preview_x = button.rect.right + 20
+            preview_y = button.rect.centery - THEME_PREVIEW_SIZE
+            chrome.blit(self._theme_previews[theme_name], (preview_x, preview_y))
         
-        # Draw theme buttons with adequate spacing
-        button_y_start = 140
-        button_spacing = 10
+        return chrome
+    
+    def draw_settings(self, surface: pygame.Surface, settings_manager, return_to_game: bool = False) -> None:
+        """draws the settings screen."""
         current_theme = settings_manager.get_theme()
+        music_enabled = settings_manager.is_music_enabled()
         
-        # Adjust button positions
-        for i, (theme_name, button) in enumerate(self.theme_buttons.items()):
-            # Update button position to ensure proper spacing
-            button.rect.y = button_y_start + i * (button.rect.height + button_spacing)
-            
-            # Highlight the current theme
+        # Get mouse position for button updates
+        mouse_pos = self._mouse_pos
+        
+        # Highlight the current theme (button positions are fixed at init)
+        for theme_name, button in self.theme_buttons.items():
             if theme_name == current_theme:
                 button.color = (100, 120, 160)
             else:
                 button.color = COLOR_BUTTON
-                
-            button.update(mouse_pos)
-            button.draw(surface)
-            
-            # Add a small preview of the theme next to the button
-            theme_colors = THEMES[theme_name]
-            preview_size = 20
-            preview_x = button.rect.right + 20
-            preview_y = button.rect.centery - preview_size
-            
-            # Draw mini-board preview (2x2 squares)
-            for i in range(2):
-                for j in range(2):
-                    is_light = (i + j) % 2 != 0
-                    color = theme_colors["light_square"] if is_light else theme_colors["dark_square"]
-                    pygame.draw.rect(surface, color, 
-                                    (preview_x + i * preview_size, 
-                                     preview_y + j * preview_size, 
-                                     preview_size, preview_size))
         
-        # Calculate music button position
-        last_theme_button = list(self.theme_buttons.values())[-1]
-        music_button_y = last_theme_button.rect.bottom + 20
-        
-        # Update music toggle button position
-        self.music_toggle_button.rect.y = music_button_y
-        
-        # Draw music toggle button
-        music_state = "On" if settings_manager.is_music_enabled() else "Off"
-        self.music_toggle_button.update_text(f"Music: {music_state}")
-        self.music_toggle_button.update(mouse_pos)
-        self.music_toggle_button.draw(surface)
+        # Music toggle sits below the last theme button
+        music_button_y = self.music_toggle_button.rect.y
         
         # Create volume slider if it doesn't exist
         if not hasattr(self, 'volume_slider'):
@@ -1040,23 +1415,40 @@ class ChessUI:
             slider_y = music_button_y + 50
             self.volume_slider = VolumeSlider(slider_x, slider_y, slider_width, slider_height)
         
+        # Rebuild the static chrome only when the theme changes
+        if current_theme != self._settings_chrome_key:
+            self._settings_chrome = self._build_settings_chrome(current_theme)
+            self._settings_chrome_key = current_theme
+        surface.blit(self._settings_chrome, (0, 0))
+        
+        # Draw theme buttons
+        theme_buttons = tuple(self.theme_buttons.values())
+        self._update_hover(theme_buttons, mouse_pos)
+        for button in theme_buttons:
+            button.draw(surface)
+        
+        # Draw music toggle button
+        self.music_toggle_button.update_text("Music: On" if music_enabled else "Music: Off")
+        self.music_toggle_button.update(mouse_pos)
+        self.music_toggle_button.draw(surface)
+        
         # Only show volume slider if music is enabled
-        if settings_manager.is_music_enabled():
-            # Draw volume label
-            volume_label = self.small_font.render("Volume", True, COLOR_TEXT)
+        if music_enabled:
+            # Draw volume label after the music button, which overlaps it
+            volume_label = self._render(self.small_font, "Volume", COLOR_TEXT)
             surface.blit(volume_label, (self.volume_slider.rect.centerx - volume_label.get_width() // 2, 
-                                      self.volume_slider.rect.top - 25))
+                                        self.volume_slider.rect.top - 25))
             
             # Draw volume slider
             self.volume_slider.draw(surface)
             
             # Draw volume percentage
-            volume_text = self.small_font.render(f"{int(self.volume_slider.value * 100)}%", True, COLOR_TEXT)
-            surface.blit(volume_text, (self.volume_slider.rect.centerx - volume_text.get_width() // 2, 
-                                      self.volume_slider.rect.bottom + 10))
+            volume_text = self._render_text(self.small_font, f"{int(self.volume_slider.value * 100)}%", COLOR_TEXT)
+            surface.blit(volume_text.surface, (self.volume_slider.rect.centerx - volume_text.width // 2, 
+                                              self.volume_slider.rect.bottom + 10))
         
         # Update back button position - ensure it's always visible
-        self.back_button.rect.y = music_button_y + (120 if settings_manager.is_music_enabled() else 70)
+        self.back_button.rect.y = music_button_y + (120 if music_enabled else 70)
         
         # Update back button text based on where we should return to
         back_text = "Back to Game" if return_to_game else "Back to Menu"
@@ -1068,51 +1460,76 @@ class ChessUI:
         self.universal_back_button.update(mouse_pos)
         self.universal_back_button.draw(surface)
     
-    def draw_player_vs_ai_screen(self, surface: pygame.Surface, difficulty: int, ai_rating: int, selected_color: chess.Color = None) -> None:
-        """Draw the Player vs AI game mode selection screen with integrated color selection."""
+    def _build_player_vs_ai_chrome(self, ai_rating: int) -> pygame.Surface:
+        """
+        Render the static parts of the Player vs AI screen to an off-screen surface
+        
+        Args:
+            ai_rating: AI rating shown in the rating panel
+        
+        Returns:
+            Surface holding the background, title, rating panel and color label
+        """
+        chrome = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        
         # Draw background
-        self.draw_theme_background(surface, "default")
+        self.draw_theme_background(chrome, "default")
         
         # Draw title
-        title = self.large_font.render("Player vs AI", True, COLOR_TEXT)
-        surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 100))
+        title = self._render(self.large_font, "Player vs AI", COLOR_TEXT)
+        chrome.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 100))
         
         # Center position for all elements
         center_x = WINDOW_WIDTH // 2
         
         # Draw AI rating with background for better visibility
-        ai_label = self.medium_font.render(f"AI Rating: {ai_rating}", True, COLOR_TEXT)
+        ai_label = self._render(self.medium_font, f"AI Rating: {ai_rating}", COLOR_TEXT)
         rating_width = ai_label.get_width() + 40  # Make it wider to avoid overlap with buttons
         rating_height = ai_label.get_height() + 10
         rating_x = center_x - rating_width // 2
         rating_y = 180  # Moved up to make room for color selection
+        self._rating_rect = pygame.Rect(rating_x, rating_y, rating_width, rating_height)
 
         # Draw rating background
-        pygame.draw.rect(surface, COLOR_BUTTON, 
-                        (rating_x, rating_y, rating_width, rating_height))
-        pygame.draw.rect(surface, (50, 50, 50), 
-                        (rating_x, rating_y, rating_width, rating_height), 1)
-        surface.blit(ai_label, (center_x - ai_label.get_width() // 2, 
-                              rating_y + 5))
+        pygame.draw.rect(chrome, COLOR_BUTTON, self._rating_rect)
+        pygame.draw.rect(chrome, (50, 50, 50), self._rating_rect, 1)
+        chrome.blit(ai_label, (center_x - ai_label.get_width() // 2, 
+                               rating_y + 5))
+        
+        # Draw color selection section label
+        color_label = self._render(self.medium_font, "Select a Color:", COLOR_TEXT)
+        chrome.blit(color_label, (center_x - color_label.get_width() // 2, 250))
+        
+        return chrome
+    
+    def draw_player_vs_ai_screen(self, surface: pygame.Surface, difficulty: int, ai_rating: int, selected_color: chess.Color = None) -> None:
+        """Draw the Player vs AI game mode selection screen with integrated color selection."""
+        # Rebuild the static chrome only when the AI rating changes
+        if ai_rating != self._player_vs_ai_chrome_key:
+            self._player_vs_ai_chrome = self._build_player_vs_ai_chrome(ai_rating)
+            self._player_vs_ai_chrome_key = ai_rating
+        surface.blit(self._player_vs_ai_chrome, (0, 0))
+        
+        # Center position for all elements
+        center_x = WINDOW_WIDTH // 2
         
         # Position and draw difficulty adjustment buttons
+        rating_rect = self._rating_rect
         button_spacing = 20  # Space between rating box and buttons
-        self.difficulty_down_button.rect.x = rating_x - self.difficulty_down_button.rect.width - button_spacing
-        self.difficulty_down_button.rect.centery = rating_y + rating_height // 2
+        self.difficulty_down_button.rect.x = rating_rect.x - self.difficulty_down_button.rect.width - button_spacing
+        self.difficulty_down_button.rect.centery = rating_rect.centery
         
-        self.difficulty_up_button.rect.x = rating_x + rating_width + button_spacing
-        self.difficulty_up_button.rect.centery = rating_y + rating_height // 2
+        self.difficulty_up_button.rect.x = rating_rect.right + button_spacing
+        self.difficulty_up_button.rect.centery = rating_rect.centery
         
-        mouse_pos = pygame.mouse.get_pos()
-        self.difficulty_up_button.update(mouse_pos)
-        self.difficulty_down_button.update(mouse_pos)
-        self.difficulty_up_button.draw(surface)
-        self.difficulty_down_button.draw(surface)
+        mouse_pos = self._mouse_pos
+        buttons = (self.difficulty_up_button, self.difficulty_down_button)
+        self._update_hover(buttons, mouse_pos)
+        for btn in buttons:
+            btn.draw(surface)
         
-        # Draw color selection section
+        # Color selection section
         color_section_y = 250
-        color_label = self.medium_font.render("Select a Color:", True, COLOR_TEXT)
-        surface.blit(color_label, (center_x - color_label.get_width() // 2, color_section_y))
         
         # Position color selection buttons
         button_width = 120
@@ -1127,10 +1544,7 @@ class ChessUI:
         self.random_button.rect = pygame.Rect(start_x + (button_width + button_spacing) * 2, color_section_y + 40, button_width, button_height)
 
         # Update button states
-        mouse_pos = pygame.mouse.get_pos()
-        self.white_button.update(mouse_pos)
-        self.black_button.update(mouse_pos)
-        self.random_button.update(mouse_pos)
+        self._update_hover((self.white_button, self.black_button, self.random_button), mouse_pos)
 
         # Draw buttons with special visuals for the selected one
         if selected_color == chess.WHITE:
@@ -1174,87 +1588,123 @@ class ChessUI:
         # Display error message if needed
         if self.show_message and time.time() - self.message_start_time < self.message_duration:
             message_font = self.medium_font
-            message_surface = message_font.render(self.message_text, True, (255, 50, 50))  # Red text for error
+            message_surface, message_width, message_height = self._render_text(
+                message_font, self.message_text, (255, 50, 50))  # Red text for error
             
             # Create a background for the message
             msg_padding = 10
             msg_bg_rect = pygame.Rect(
-                center_x - message_surface.get_width() // 2 - msg_padding,
+                center_x - message_width // 2 - msg_padding,
                 color_section_y + 150,
-                message_surface.get_width() + msg_padding * 2,
-                message_surface.get_height() + msg_padding * 2
+                message_width + msg_padding * 2,
+                message_height + msg_padding * 2
             )
             
-            # Draw semi-transparent background
-            s = pygame.Surface((msg_bg_rect.width, msg_bg_rect.height), pygame.SRCALPHA)
-            s.fill((0, 0, 0, 180))  # Black with alpha
+            # Draw semi-transparent background, created once per message size
+            s = self._msg_overlay_cache.get(msg_bg_rect.size)
+            if s is None:
+                s = pygame.Surface(msg_bg_rect.size, pygame.SRCALPHA).convert_alpha()
+                s.fill((0, 0, 0, 180))  # Black with alpha
+                self._msg_overlay_cache[msg_bg_rect.size] = s
             surface.blit(s, (msg_bg_rect.x, msg_bg_rect.y))
             
             # Draw message
-            surface.blit(message_surface, (center_x - message_surface.get_width() // 2, color_section_y + 150 + msg_padding))
+            surface.blit(message_surface, (center_x - message_width // 2, color_section_y + 150 + msg_padding))
     
-    def draw_captured_pieces(self, surface: pygame.Surface, board_state: Any) -> None:
-        """Draw captured pieces on the side of the board"""
-        # Check if board_state is a dictionary or a GameBoard object
-        if isinstance(board_state, dict):
-            # If it's a dictionary, use it directly
-            white_captures = board_state.get('white', [])
-            black_captures = board_state.get('black', [])
-        else:
-            # If it's a GameBoard object, call its method
-            captures = board_state.get_all_captured_pieces()
-            white_captures = captures['white']
-            black_captures = captures['black']
+    def _build_sidebar_layer(self, white_captures: List[chess.Piece],
+                             black_captures: List[chess.Piece]) -> pygame.Surface:
+        """
+        Render the captured pieces panel, laid out relative to its own top-left corner
         
+        Args:
+            white_captures: White pieces captured by black
+            black_captures: Black pieces captured by white
+            
+        Returns:
+            Surface covering the captured pieces area beside the board
+        """
         # Clear background for captured pieces area
-        captured_area_rect = pygame.Rect(
-            BOARD_OFFSET_X + BOARD_SIZE + 10, 
-            BOARD_OFFSET_Y,
-            200, 
-            BOARD_SIZE
-        )
-        pygame.draw.rect(surface, COLOR_BACKGROUND, captured_area_rect)
+        layer = pygame.Surface((200, BOARD_SIZE)).convert()
+        layer.fill(COLOR_BACKGROUND)
+        
+        # Labels and pieces are collected here and blitted in one call
+        blit_list = []
         
         # Draw sections for captured pieces
-        x_pos = BOARD_OFFSET_X + BOARD_SIZE + 20
+        x_pos = 10
         
         # Draw header for pieces captured by player
-        y_pos = BOARD_OFFSET_Y + 10
-        player_captures_label = self.small_font.render("Captured by You:", True, COLOR_TEXT)
-        surface.blit(player_captures_label, (x_pos, y_pos))
+        y_pos = 10
+        player_captures_label = self._render(self.small_font, "Captured by You:", COLOR_TEXT)
+        blit_list.append((player_captures_label, (x_pos, y_pos)))
         
         # Draw white's captures (black pieces)
         y_pos += 30
         for i, piece in enumerate(black_captures):
-            # Make sure we're only showing black pieces here (pieces captured by white player)
-            if piece.color == chess.BLACK:
-                piece_key = 'p' if piece.symbol().lower() == 'p' else piece.symbol().lower()
-                if piece_key in self.piece_images:
-                    # Scale down for captured piece display
-                    small_piece = pygame.transform.scale(
-                        self.piece_images[piece_key], 
-                        (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
-                    )
-                    surface.blit(small_piece, (x_pos + (i % 4) * (SQUARE_SIZE // 2), y_pos + (i // 4) * (SQUARE_SIZE // 2)))
+            piece_key = piece.symbol()
+            if piece_key in self.piece_images:
+                # Use the pre-scaled image for captured piece display
+                small_piece = self.piece_images_small[piece_key]
+                blit_list.append((small_piece, (x_pos + (i % 4) * (SQUARE_SIZE // 2), y_pos + (i // 4) * (SQUARE_SIZE // 2))))
         
         # Draw header for pieces captured by AI
-        y_pos = BOARD_OFFSET_Y + BOARD_SIZE // 2
-        ai_captures_label = self.small_font.render("Captured by AI:", True, COLOR_TEXT)
-        surface.blit(ai_captures_label, (x_pos, y_pos))
+        y_pos = BOARD_SIZE // 2
+        ai_captures_label = self._render(self.small_font, "Captured by AI:", COLOR_TEXT)
+        blit_list.append((ai_captures_label, (x_pos, y_pos)))
         
         # Draw black's captures (white pieces)
         y_pos += 30
         for i, piece in enumerate(white_captures):
-            # Make sure we're only showing white pieces here (pieces captured by black player)
-            if piece.color == chess.WHITE:
-                piece_key = 'P' if piece.symbol().upper() == 'P' else piece.symbol().upper()
-                if piece_key in self.piece_images:
-                    # Scale down for captured piece display
-                    small_piece = pygame.transform.scale(
-                        self.piece_images[piece_key], 
-                        (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
-                    )
-                    surface.blit(small_piece, (x_pos + (i % 4) * (SQUARE_SIZE // 2), y_pos + (i // 4) * (SQUARE_SIZE // 2)))
+            piece_key = piece.symbol()
+            if piece_key in self.piece_images:
+                # Use the pre-scaled image for captured piece display
+                small_piece = self.piece_images_small[piece_key]
+                blit_list.append((small_piece, (x_pos + (i % 4) * (SQUARE_SIZE // 2), y_pos + (i // 4) * (SQUARE_SIZE // 2))))
+        
+        layer.blits(blit_list, doreturn=False)
+        return layer
+    
+    def draw_captured_pieces(self, surface: pygame.Surface, board_state: Any) -> None:
+        """Draw captured pieces on the side of the board"""
+        captures = board_state.get_all_captured_pieces()
+        white_captures = captures['white']
+        black_captures = captures['black']
+        
+        # Re-render the panel only when the captured pieces change
+        sidebar_key = (tuple(white_captures), tuple(black_captures))
+        if sidebar_key != self._sidebar_key:
+            self._sidebar_layer = self._build_sidebar_layer(white_captures, black_captures)
+            self._sidebar_key = sidebar_key
+        surface.blit(self._sidebar_layer, (BOARD_OFFSET_X + BOARD_SIZE + 10, BOARD_OFFSET_Y))
+    
+    def _compose_line(self, text: str) -> pygame.Surface:
+        """
+        Assemble a line of text from the move history glyph atlas
+        
+        Args:
+            text: Text to lay out
+            
+        Returns:
+            Transparent surface holding the composed line
+        """
+        # Make sure every character has a glyph
+        for ch in text:
+            if ch not in self._glyph_surfs:
+                glyph = self.small_font.render(ch, True, COLOR_TEXT).convert_alpha()
+                self._glyph_surfs[ch] = glyph
+                self._glyph_widths[ch] = glyph.get_width()
+        
+        width = sum(self._glyph_widths[ch] for ch in text)
+        height = max((self._glyph_surfs[ch].get_height() for ch in text), default=1)
+        line = pygame.Surface((max(width, 1), height), pygame.SRCALPHA).convert_alpha()
+        
+        # A transparent fill in the text color keeps antialiased glyph edges intact
+        line.fill((*COLOR_TEXT, 0))
+        x = 0
+        for ch in text:
+            line.blit(self._glyph_surfs[ch], (x, 0))
+            x += self._glyph_widths[ch]
+        return line
     
     def draw_move_history(self, surface: pygame.Surface, board_state: Any) -> None:
         """Draw the move history sidebar"""
@@ -1268,33 +1718,49 @@ class ChessUI:
         pygame.draw.rect(surface, COLOR_LIGHT_GRAY, history_rect, border_radius=5)
         
         # Draw title
-        history_title = self.small_font.render("Move History", True, COLOR_TEXT)
-        surface.blit(history_title, (history_x + 10, history_y + 10))
+        history_title = self._render(self.small_font, "Move History", COLOR_TEXT)
+        
+        # No moves yet - only the empty panel is shown
+        move_history = board_state.move_history
+        if not move_history:
+            self._move_history_cache.clear()
+            surface.blit(history_title, (history_x + 10, history_y + 10))
+            return
+        
+        blit_list = [(history_title, (history_x + 10, history_y + 10))]
         
         # Draw moves
         move_y = history_y + 40
         max_displayed = 15  # Maximum number of moves to display
         
         # Calculate which moves to display based on the total
-        move_history = board_state.move_history
         start_idx = max(0, len(move_history) - max_displayed)
         
+        # Keep one cache slot per move, dropping slots for undone moves
+        cache = self._move_history_cache
+        del cache[len(move_history):]
+        cache.extend([None] * (len(move_history) - len(cache)))
+        
         for i, move in enumerate(move_history[start_idx:]):
             move_idx = start_idx + i
-            move_num = move_idx // 2 + 1
-            is_white = move_idx % 2 == 0
-            
-            # Format the move number and move
-            prefix = f"{move_num}." if is_white else "   "
-            move_text = prefix + move.uci()
-            
-            # Render the move text
-            text = self.small_font.render(move_text, True, COLOR_TEXT)
             text_y = move_y + i * 20
             
             # Only draw if it fits in the history box
             if text_y < history_y + history_rect.height - 20:
-                surface.blit(text, (history_x + 10, text_y))
+                # Compose the line only when this slot holds a different move
+                entry = cache[move_idx]
+                if entry is None or entry[0] != move:
+                    move_num = move_idx // 2 + 1
+                    is_white = move_idx % 2 == 0
+                    
+                    # Format the move number and move
+                    prefix = f"{move_num}." if is_white else "   "
+                    entry = (move, self._compose_line(prefix + move.uci()))
+                    cache[move_idx] = entry
+                
+                blit_list.append((entry[1], (history_x + 10, text_y)))
+        
+        surface.blits(blit_list, doreturn=False)
     
     def draw_game_info(self, surface: pygame.Surface, board_state: Any, 
                        human_turn: bool, ai_level: int, 
@@ -1330,28 +1796,27 @@ class ChessUI:
     def draw_game_result(self, surface: pygame.Surface, result_message: str, ai_rating: Optional[int] = None) -> None:
         """draws the game result screen."""
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Black with alpha
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay_dim_180, (0, 0))
         
         # Draw result message
-        result_surface = self.large_font.render(result_message, True, (255, 255, 255))
-        surface.blit(result_surface, 
-                    (WINDOW_WIDTH // 2 - result_surface.get_width() // 2, 
+        result_text = self._render_text(self.large_font, result_message, (255, 255, 255))
+        surface.blit(result_text.surface, 
+                    (WINDOW_WIDTH // 2 - result_text.width // 2, 
                      WINDOW_HEIGHT // 2 - 100))
         
         # Draw updated AI rating only for AI games (not for local multiplayer)
         if ai_rating is not None:
-            ai_surface = self.medium_font.render(
+            ai_text = self._render_text(
+                self.medium_font,
                 f"AI Rating: {ai_rating}", 
-                True, (255, 255, 255)
+                (255, 255, 255)
             )
-            surface.blit(ai_surface, 
-                        (WINDOW_WIDTH // 2 - ai_surface.get_width() // 2, 
+            surface.blit(ai_text.surface, 
+                        (WINDOW_WIDTH // 2 - ai_text.width // 2, 
                          WINDOW_HEIGHT // 2))
         
         # Draw menu button
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         self.menu_button.update(mouse_pos)
         self.menu_button.draw(surface)
         
@@ -1365,12 +1830,12 @@ class ChessUI:
         dots = "." * (int(thinking_time * 2) % 4)
         thinking_text = f"AI thinking{dots}"
         
-        thinking_surface = self.medium_font.render(thinking_text, True, (220, 220, 0))
+        thinking_surface = self._render(self.medium_font, thinking_text, (220, 220, 0))
         surface.blit(thinking_surface, (WINDOW_WIDTH - 180, WINDOW_HEIGHT - 50))
         
         # Draw time elapsed
         time_text = f"Time: {thinking_time:.1f}s"
-        time_surface = self.small_font.render(time_text, True, COLOR_TEXT)
+        time_surface = self._render(self.small_font, time_text, COLOR_TEXT)
         surface.blit(time_surface, (WINDOW_WIDTH - 180, WINDOW_HEIGHT - 25))
     
     def draw_theme_background(self, surface: pygame.Surface, theme: str) -> None:
@@ -1391,15 +1856,15 @@ class ChessUI:
     def draw_color_selection(self, surface: pygame.Surface) -> None:
         """Draw the color selection screen"""
         # Draw title
-        title = self.large_font.render("Choose Your Color", True, COLOR_TEXT)
+        title = self._render(self.large_font, "Choose Your Color", COLOR_TEXT)
         surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 80))
         
         # Draw description
-        description = self.medium_font.render("Select the color you want to play as", True, COLOR_TEXT)
+        description = self._render(self.medium_font, "Select the color you want to play as", COLOR_TEXT)
         surface.blit(description, (WINDOW_WIDTH // 2 - description.get_width() // 2, 130))
         
         # Draw buttons
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         self.white_button.update(mouse_pos)
         self.white_button.draw(surface)
         self.black_button.update(mouse_pos)
@@ -1427,62 +1892,78 @@ class ChessUI:
     def draw_hint_selection(self, surface: pygame.Surface) -> None:
         """Draw the hint selection screen"""
         # Draw title
-        title = self.large_font.render("Choose Hint Count", True, COLOR_TEXT)
+        title = self._render(self.large_font, "Choose Hint Count", COLOR_TEXT)
         surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 80))
         
         # Draw description
-        description = self.medium_font.render("How many hints do you want?", True, COLOR_TEXT)
+        description = self._render(self.medium_font, "How many hints do you want?", COLOR_TEXT)
         surface.blit(description, (WINDOW_WIDTH // 2 - description.get_width() // 2, 130))
         
         # Draw buttons
-        mouse_pos = pygame.mouse.get_pos()
-        self.no_hints_button.update(mouse_pos)
-        self.no_hints_button.draw(surface)
-        self.one_hint_button.update(mouse_pos)
-        self.one_hint_button.draw(surface)
-        self.two_hints_button.update(mouse_pos)
-        self.two_hints_button.draw(surface)
-        self.three_hints_button.update(mouse_pos)
-        self.three_hints_button.draw(surface)
+        mouse_pos = self._mouse_pos
+        buttons = (self.no_hints_button, self.one_hint_button,
+                   self.two_hints_button, self.three_hints_button,
+                   self.universal_back_button)
+        self._update_hover(buttons, mouse_pos)
+        for btn in buttons:
+            btn.draw(surface)
+    
+    def _make_glow_sprite(self, text: str, font: pygame.font.Font, color: tuple,
+                          max_offset: int = GLOW_OFFSET) -> pygame.Surface:
+        """
+        Compose the diagonal glow copies of a text into one cached sprite
         
-        # Draw universal back button
-        self.universal_back_button.update(mouse_pos)
-        self.universal_back_button.draw(surface)
+        Args:
+            text: Text to glow
+            font: Font to render with
+            color: Glow color
+            max_offset: Largest diagonal offset of the glow copies
+            
+        Returns:
+            Sprite padded by max_offset on every side, to blit at the text position minus max_offset
+        """
+        key = (text, id(font), color)
+        sprite = self._glow_cache.get(key)
+        if sprite is None:
+            glow_text = font.render(text, True, color)
+            sprite = pygame.Surface(
+                (glow_text.get_width() + 2 * max_offset, glow_text.get_height() + 2 * max_offset),
+                pygame.SRCALPHA
+            )
+            # Every copy has the same color, so a transparent fill in it leaves only alpha to accumulate
+            sprite.fill((*color[:3], 0))
+            for offset in range(max_offset, 0, -1):
+                for dx, dy in ((-offset, -offset), (offset, -offset), (-offset, offset), (offset, offset)):
+                    sprite.blit(glow_text, (max_offset + dx, max_offset + dy))
+            sprite = sprite.convert_alpha()
+            self._glow_cache[key] = sprite
+        return sprite
     
     def draw_checkmate_overlay(self, surface: pygame.Surface) -> None:
         """Draw a CHECKMATE overlay on the game screen"""
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Semi-transparent black
-        surface.blit(overlay, (0, 0))
-        
-        # Space out the letters for more visual impact
-        spaced_text = "C    H    E    C    K    M    A    T    E"
+        # Semi-transparent black overlay
+        surface.blit(self._overlay_dim_128, (0, 0))
         
-        # Draw CHECKMATE text with larger font for better visibility
-        bigger_font = pygame.font.SysFont("Arial", 60)  # Increased from 48
-        text = bigger_font.render(spaced_text, True, (255, 50, 50))
+        # Draw the pre-rendered CHECKMATE text
+        text = self._checkmate_text_surf
         text_width = text.get_width()
         text_x = WINDOW_WIDTH // 2 - text_width // 2
         text_y = WINDOW_HEIGHT // 2 - 50
         
         # Add glow effect
-        for offset in range(3, 0, -1):
-            glow_text = bigger_font.render(spaced_text, True, (200, 50, 50, 128))
-            surface.blit(glow_text, (text_x - offset, text_y - offset))
-            surface.blit(glow_text, (text_x + offset, text_y - offset))
-            surface.blit(glow_text, (text_x - offset, text_y + offset))
-            surface.blit(glow_text, (text_x + offset, text_y + offset))
+        surface.blit(self._checkmate_glow_sprite, (text_x - GLOW_OFFSET, text_y - GLOW_OFFSET))
         
         # Draw main text
         surface.blit(text, (text_x, text_y))
 
     def draw_result_overlay(self, surface: pygame.Surface, is_winner: bool) -> None:
         """Draw a WIN/LOSE overlay on the game screen"""
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))  # Semi-transparent black
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent black overlay, rendered once and reused
+        if self._result_overlay is None:
+            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            self._result_overlay = overlay.convert_alpha()
+        surface.blit(self._result_overlay, (0, 0))
         
         # Space out the letters for more visual impact
         win_text = "Y O U   W I N !"
@@ -1493,20 +1974,14 @@ class ChessUI:
         text_color = (50, 255, 50) if is_winner else (255, 50, 50)  # Green for win, red for lose
         
         # Use larger font for better visibility
-        bigger_font = pygame.font.SysFont("Arial", 60)  # Increased from 48
-        text = bigger_font.render(text_content, True, text_color)
-        text_width = text.get_width()
+        text, text_width, _ = self._render_text(self.huge_font, text_content, text_color)
         text_x = WINDOW_WIDTH // 2 - text_width // 2
         text_y = WINDOW_HEIGHT // 2 - 50
         
         # Add glow effect
         glow_color = (50, 200, 50, 128) if is_winner else (200, 50, 50, 128)
-        for offset in range(3, 0, -1):
-            glow_text = bigger_font.render(text_content, True, glow_color)
-            surface.blit(glow_text, (text_x - offset, text_y - offset))
-            surface.blit(glow_text, (text_x + offset, text_y - offset))
-            surface.blit(glow_text, (text_x - offset, text_y + offset))
-            surface.blit(glow_text, (text_x + offset, text_y + offset))
+        glow_sprite = self._make_glow_sprite(text_content, self.huge_font, glow_color)
+        surface.blit(glow_sprite, (text_x - GLOW_OFFSET, text_y - GLOW_OFFSET))
         
         # Draw main text
         surface.blit(text, (text_x, text_y))
@@ -1534,7 +2009,7 @@ class ChessUI:
         """
         font = font or self.medium_font
         color = color or COLOR_TEXT
-        text_surface = font.render(text, True, color)
+        text_surface = self._render(font, text, color)
         surface.blit(text_surface, position)
 
     def draw_time_constraint_selection(self, surface: pygame.Surface) -> None:
@@ -1543,109 +2018,17 @@ class ChessUI:
         self.draw_theme_background(surface, "default")
         
         # Draw title
-        title = self.large_font.render("Select Time Constraint", True, COLOR_TEXT)
+        title = self._render(self.large_font, "Select Time Constraint", COLOR_TEXT)
         surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 60))
         
-        # Load icons
-        icons = {}
-        icon_paths = {
-            "bullet": os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "time_limit", "bullet_chess.png"),
-            "blitz": os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "time_limit", "blitz_chess.png"),
-            "rapid": os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "time_limit", "rapid_chess.png"),
-            "no_time": os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "time_limit", "no_time_constraint.png")
-        }
-        
-        for key, path in icon_paths.items():
-            if os.path.exists(path):
-                icons[key] = pygame.image.load(path)
-                icons[key] = pygame.transform.scale(icons[key], (40, 40))
-            else:
-                print(f"Warning: Icon {path} not found")
-        
-        # Calculate positions
-        center_x = WINDOW_WIDTH // 2
-        button_width = 300
-        button_height = 60
-        button_spacing = 20
-        start_y = 120
-        
-        # Create buttons if they don't exist
-        if not hasattr(self, 'bullet_button'):
-            self.bullet_button = Button(
-                center_x - button_width // 2,
-                start_y,
-                button_width,
-                button_height,
-                "Bullet Chess - 1 min"
-            )
-        
-        if not hasattr(self, 'blitz_3_button'):
-            self.blitz_3_button = Button(
-                center_x - button_width // 2,
-                start_y + button_height + button_spacing,
-                button_width,
-                button_height,
-                "Blitz Chess - 3 min"
-            )
-            
-        if not hasattr(self, 'blitz_5_button'):
-            self.blitz_5_button = Button(
-                center_x - button_width // 2,
-                start_y + (button_height + button_spacing) * 2,
-                button_width,
-                button_height,
-                "Blitz Chess - 5 min"
-            )
-            
-        if not hasattr(self, 'rapid_button'):
-            self.rapid_button = Button(
-                center_x - button_width // 2,
-                start_y + (button_height + button_spacing) * 3,
-                button_width,
-                button_height,
-                "Rapid Chess - 10 min"
-            )
-            
-        if not hasattr(self, 'no_time_button'):
-            self.no_time_button = Button(
-                center_x - button_width // 2,
-                start_y + (button_height + button_spacing) * 4,
-                button_width,
-                button_height,
-                "No Time Constraint"
-            )
-        
         # Update and draw buttons
-        mouse_pos = pygame.mouse.get_pos()
-        
-        self.bullet_button.update(mouse_pos)
-        self.bullet_button.draw(surface)
-        
-        self.blitz_3_button.update(mouse_pos)
-        self.blitz_3_button.draw(surface)
-        
-        self.blitz_5_button.update(mouse_pos)
-        self.blitz_5_button.draw(surface)
-        
-        self.rapid_button.update(mouse_pos)
-        self.rapid_button.draw(surface)
-        
-        self.no_time_button.update(mouse_pos)
-        self.no_time_button.draw(surface)
+        mouse_pos = self._mouse_pos
+        for button in self._time_buttons:
+            button.update(mouse_pos)
+            button.draw(surface)
         
         # Draw icons next to buttons if loaded
-        if "bullet" in icons:
-            surface.blit(icons["bullet"], (self.bullet_button.rect.x - 50, self.bullet_button.rect.centery - 20))
-        
-        if "blitz" in icons:
-            surface.blit(icons["blitz"], (self.blitz_3_button.rect.x - 50, self.blitz_3_button.rect.centery - 20))
-            surface.blit(icons["blitz"], (self.blitz_5_button.rect.x - 50, self.blitz_5_button.rect.centery - 20))
-        
-        if "rapid" in icons:
-            surface.blit(icons["rapid"], (self.rapid_button.rect.x - 50, self.rapid_button.rect.centery - 20))
-        
-        if "no_time" in icons:
-            surface.blit(icons["no_time"], (self.no_time_button.rect.x - 50, self.no_time_button.rect.centery - 20))
+        self._blit_batch(surface, self._time_icon_blits)
 
         # Draw universal back button
         self.universal_back_button.update(mouse_pos)
@@ -1658,6 +2041,22 @@ class ChessUI:
                                white_time: int, black_time: int,
                                current_theme: str = "default") -> None:
         """Draw the local multiplayer game interface with chess clocks"""
+        # Nothing on this screen changes unless one of these does (or a piece is moving)
+        mouse_pos = self._mouse_pos
+        state_key = (board_state.board.board_fen(), white_time, black_time, current_player,
+                     selected_square, tuple(highlighted_squares), current_theme, mouse_pos,
+                     self.board_flipped, getattr(self, 'last_clicked_square', None))
+        if self.animations:
+            state_key = None
+        
+        # Unchanged since the previous frame: restore the retained frame and skip the display update
+        if (state_key is not None and self._prev_frame_was_local_mp
+                and state_key == self._local_mp_state_key):
+            surface.blit(self._local_mp_frame, (0, 0))
+            self.dirty_rects = []
+            self._frame_was_local_mp = True
+            return
+        
         # Draw the board and pieces
         self.draw_board(surface, board_state, current_theme)
         self.draw_board_labels(surface)
@@ -1682,12 +2081,9 @@ class ChessUI:
             white_color = (50, 200, 50) if current_player == chess.WHITE else COLOR_TEXT
             black_color = (50, 200, 50) if current_player == chess.BLACK else COLOR_TEXT
             
-            # Create bold font for time display
-            bold_font = pygame.font.SysFont("Arial", FONT_SIZE_MEDIUM, bold=True)
-            
-            # Draw time indicators with bold font
-            white_time_surface = bold_font.render(white_time_str, True, white_color)
-            black_time_surface = bold_font.render(black_time_str, True, black_color)
+            # Draw time indicators with bold font, rendered only when a clock ticks
+            white_time_surface = self._render_clock(white_time_str, white_color)
+            black_time_surface = self._render_clock(black_time_str, black_color)
             
             # Position time indicators on the right side of the board
             # White at bottom, Black at top
@@ -1696,12 +2092,9 @@ class ChessUI:
             surface.blit(black_time_surface, (right_margin, 100))
         
         # Draw current player indicator
-        turn_text = "White's Turn" if current_player == chess.WHITE else "Black's Turn"
-        turn_surface = self.medium_font.render(turn_text, True, COLOR_TEXT)
-        surface.blit(turn_surface, (BOARD_OFFSET_X + BOARD_SIZE + 20, 50))
+        surface.blit(self._turn_surfaces[current_player], (BOARD_OFFSET_X + BOARD_SIZE + 20, 50))
         
         # Draw in-game settings button
-        mouse_pos = pygame.mouse.get_pos()
         self.in_game_settings_button.update(mouse_pos)
         self.in_game_settings_button.draw(surface)
         
@@ -1709,84 +2102,52 @@ class ChessUI:
         self.universal_back_button.update(mouse_pos)
         self.universal_back_button.draw(surface)
         
+        # Retain the finished frame for the following unchanged frames
+        if self._local_mp_frame is None or self._local_mp_frame.get_size() != surface.get_size():
+            self._local_mp_frame = surface.copy()
+        else:
+            self._local_mp_frame.blit(surface, (0, 0))
+        self._local_mp_state_key = state_key
+        self._frame_was_local_mp = True
+        
+    def _render_clock(self, time_str: str, color: tuple) -> pygame.Surface:
+        """
+        Render a clock readout with the bold clock font, reusing recent renders
+        
+        Args:
+            time_str: Formatted time, e.g. "04:59"
+            color: Text color
+            
+        Returns:
+            Rendered clock surface
+        """
+        key = (time_str, color)
+        clock_surface = self._clock_cache.get(key)
+        if clock_surface is None:
+            clock_surface = self._font_clock_bold.render(time_str, True, color).convert_alpha()
+            # Both clocks only need their current readouts kept
+            if len(self._clock_cache) >= CLOCK_CACHE_SIZE:
+                del self._clock_cache[next(iter(self._clock_cache))]
+            self._clock_cache[key] = clock_surface
+        return clock_surface
+    
     def draw_local_multiplayer_captured_pieces(self, surface: pygame.Surface, board_state: Any, player_color: chess.Color) -> None:
         """Draw captured pieces with proper labels for local multiplayer mode"""
-        # Get captured pieces
-        white_captured = board_state.get_captured_pieces(chess.WHITE)
-        black_captured = board_state.get_captured_pieces(chess.BLACK)
-        
-        # Draw labels for captured pieces
-        white_label = self.small_font.render("Captured by White", True, COLOR_TEXT)
-        black_label = self.small_font.render("Captured by Black", True, COLOR_TEXT)
-        
-        # Position for captured pieces display
-        white_label_pos = (BOARD_OFFSET_X + BOARD_SIZE + 20, 200)
-        black_label_pos = (BOARD_OFFSET_X + BOARD_SIZE + 20, 300)
-        
-        # Draw the labels
-        surface.blit(white_label, white_label_pos)
-        surface.blit(black_label, black_label_pos)
-        
-        # Draw the captured pieces
-        piece_size = 30
-        spacing = 5
-        
-        # Helper function to get piece symbol
-        def get_piece_symbol(piece):
-            # Convert piece to symbol (e.g., white pawn -> 'P', black knight -> 'n')
-            symbols = {
-                chess.PAWN: 'P', 
-                chess.KNIGHT: 'N', 
-                chess.BISHOP: 'B',
-                chess.ROOK: 'R', 
-                chess.QUEEN: 'Q', 
-                chess.KING: 'K'
-            }
-            symbol = symbols.get(piece.piece_type, '')
-            # Make lowercase for black pieces
-            if piece.color == chess.BLACK:
-                symbol = symbol.lower()
-            return symbol
-        
-        # Draw white's captured pieces
-        for i, piece in enumerate(white_captured):
-            col = i % 8
-            row = i // 8
-            x = white_label_pos[0] + col * (piece_size + spacing)
-            y = white_label_pos[1] + 20 + row * (piece_size + spacing)
-            
-            # Get the piece image
-            try:
-                symbol = get_piece_symbol(piece)
-                if symbol in self.piece_images:
-                    piece_img = self.piece_images[symbol]
-                    piece_img = pygame.transform.scale(piece_img, (piece_size, piece_size))
-                    surface.blit(piece_img, (x, y))
-                else:
-                    raise KeyError(f"Symbol {symbol} not found in piece_images")
-            except KeyError as e:
-                print(f"Warning: {e}")
-                continue
+        # Get captured pieces as packed piece codes
+        white_codes = board_state.get_captured_codes(chess.WHITE)
+        black_codes = board_state.get_captured_codes(chess.BLACK)
         
-        # Draw black's captured pieces
-        for i, piece in enumerate(black_captured):
-            col = i % 8
-            row = i // 8
-            x = black_label_pos[0] + col * (piece_size + spacing)
-            y = black_label_pos[1] + 20 + row * (piece_size + spacing)
-            
-            # Get the piece image
-            try:
-                symbol = get_piece_symbol(piece)
-                if symbol in self.piece_images:
-                    piece_img = self.piece_images[symbol]
-                    piece_img = pygame.transform.scale(piece_img, (piece_size, piece_size))
-                    surface.blit(piece_img, (x, y))
-                else:
-                    raise KeyError(f"Symbol {symbol} not found in piece_images")
-            except KeyError as e:
-                print(f"Warning: {e}")
-                continue
+        # Both labels (rendered once at init) start the blit sequence
+        blit_seq = list(zip(self._cap_labels, self._cap_label_pos))
+        
+        # Followed by both captured grids at their precomputed cell positions
+        images = self._piece_img_by_code
+        white_positions, black_positions = self._cap_positions
+        blit_seq += [(images[code], pos) for code, pos in zip(white_codes, white_positions) if code in images]
+        blit_seq += [(images[code], pos) for code, pos in zip(black_codes, black_positions) if code in images]
+        
+        # Draw labels and pieces in a single call
+        self._blit_batch(surface, blit_seq)
 
     def draw_mode_selection(self, screen) -> None:
         """Draw the game mode selection screen."""
@@ -1794,45 +2155,36 @@ class ChessUI:
         self.draw_theme_background(screen, "default")
         
         # Draw title
-        title = self.large_font.render("Select Game Mode", True, COLOR_TEXT)
+        title = self._render(self.large_font, "Select Game Mode", COLOR_TEXT)
         screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 100))
         
         # Center-align buttons
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         self.player_vs_ai_button.rect.centerx = WINDOW_WIDTH // 2
         self.local_multiplayer_button.rect.centerx = WINDOW_WIDTH // 2
         
-        # Update and draw buttons
-        self.player_vs_ai_button.update(mouse_pos)
-        self.player_vs_ai_button.draw(screen)
-        self.local_multiplayer_button.update(mouse_pos)
-        self.local_multiplayer_button.draw(screen)
-        
-        # Draw universal back button
-        self.universal_back_button.update(mouse_pos)
-        self.universal_back_button.draw(screen)
+        # Update and draw buttons, including the universal back button
+        buttons = (self.player_vs_ai_button, self.local_multiplayer_button,
+                   self.universal_back_button)
+        self._update_hover(buttons, mouse_pos)
+        for btn in buttons:
+            btn.draw(screen)
 
     def draw_promotion_menu(self, surface: pygame.Surface, player_color: chess.Color) -> None:
         """Draw the promotion selection menu."""
-        menu_width = 300
-        menu_height = 100
-        menu_x = (WINDOW_WIDTH - menu_width) // 2
-        menu_y = (WINDOW_HEIGHT - menu_height) // 2
-
+        # The menu covers parts of the game screen outside its dirty regions
+        self.dirty_rects = None
+        
         # Draw menu background
-        pygame.draw.rect(surface, COLOR_BACKGROUND, (menu_x, menu_y, menu_width, menu_height))
-        pygame.draw.rect(surface, COLOR_TEXT, (menu_x, menu_y, menu_width, menu_height), 2)
+        menu_rect = self._promotion_menu_rect
+        pygame.draw.rect(surface, COLOR_BACKGROUND, menu_rect)
+        pygame.draw.rect(surface, COLOR_TEXT, menu_rect, 2)
 
         # Draw promotion options
-        piece_types = [chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT]
         piece_names = ["Queen", "Rook", "Bishop", "Knight"]
         piece_images = ["Q", "R", "B", "N"] if player_color == chess.WHITE else ["q", "r", "b", "n"]
 
-        button_width = menu_width // len(piece_types)
-        for i, (piece_type, name, image_key) in enumerate(zip(piece_types, piece_names, piece_images)):
-            button_x = menu_x + i * button_width
-            button_rect = pygame.Rect(button_x, menu_y, button_width, menu_height)
-
+        for button_rect, name, image_key in zip(self._promotion_rects, piece_names, piece_images):
             # Draw button background
             pygame.draw.rect(surface, COLOR_BUTTON, button_rect)
             pygame.draw.rect(surface, COLOR_TEXT, button_rect, 2)
@@ -1844,8 +2196,8 @@ class ChessUI:
                 surface.blit(piece_image, piece_rect)
 
             # Draw piece name
-            text_surface = self.medium_font.render(name, True, COLOR_TEXT)
-            text_rect = text_surface.get_rect(center=(button_x + button_width // 2, menu_y + menu_height - 20))
+            text_surface = self._render(self.medium_font, name, COLOR_TEXT)
+            text_rect = text_surface.get_rect(center=(button_rect.centerx, button_rect.bottom - 20))
             surface.blit(text_surface, text_rect)
 
     def get_promotion_selection(self, pos: Tuple[int, int]) -> Optional[chess.PieceType]:
@@ -1858,20 +2210,9 @@ class ChessUI:
         Returns:
             The selected chess.PieceType or None if no selection was made.
         """
-        menu_width = 300
-        menu_height = 100
-        menu_x = (WINDOW_WIDTH - menu_width) // 2
-        menu_y = (WINDOW_HEIGHT - menu_height) // 2
-
-        # Define promotion options
-        piece_types = [chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT]
-        button_width = menu_width // len(piece_types)
-
-        for i, piece_type in enumerate(piece_types):
-            button_x = menu_x + i * button_width
-            button_rect = pygame.Rect(button_x, menu_y, button_width, menu_height)
+        for i, button_rect in enumerate(self._promotion_rects):
             if button_rect.collidepoint(pos):
-                return piece_type
+                return PROMOTION_PIECE_TYPES[i]
 
         return None
 
@@ -16,6 +16,51 @@ CHAT_WIDTH = 250
 CHAT_HEIGHT = 200
 CHAT_MESSAGE_HEIGHT = 20
 MAX_VISIBLE_MESSAGES = 8
+KNIGHT_RADIUS = 30
+
+# Event types the multiplayer widgets react to; anything else is ignored up front
+_HANDLED_EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
+# Spinning knight point offsets for each whole degree of rotation, computed once at import
+_KNIGHT_OFFSETS = [
+    [(int(math.cos(math.radians(a + i * 45)) * KNIGHT_RADIUS * 0.8),
+      int(math.sin(math.radians(a + i * 45)) * KNIGHT_RADIUS * 0.8)) for i in range(8)]
+    for a in range(360)
+]
+
+# Fonts shared by every multiplayer screen, keyed by (name, size)
+_FONT_CACHE: Dict[Tuple[str, int], pygame.font.Font] = {}
+
+def _get_font(name: str, size: int) -> pygame.font.Font:
+    """
+    Get a system font, loading it only the first time it is requested
+    
+    Args:
+        name: System font name
+        size: Font size in points
+        
+    Returns:
+        Shared font object
+    """
+    font = _FONT_CACHE.get((name, size))
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _FONT_CACHE[(name, size)] = font
+    return font
+
+def _render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int] = COLOR_TEXT) -> pygame.Surface:
+    """
+    Render antialiased text converted to the display's pixel format
+    
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: Text color
+        
+    Returns:
+        Surface ready for fast blitting
+    """
+    return font.render(text, True, color).convert_alpha()
 
 class ChatBox:
     """Chat interface for multiplayer games"""
@@ -32,9 +77,9 @@ class ChatBox:
             "Send", 
             font_size=FONT_SIZE_SMALL
         )
-        self.input_text = ""
+        self.input_text = ""  # Stored as a list of characters, see the input_text property
         self.active = False
-        self.font = pygame.font.SysFont("Arial", FONT_SIZE_SMALL)
+        self.font = _get_font("Arial", FONT_SIZE_SMALL)
         self.scroll_offset = 0
         self.max_scroll = 0
         self.on_send: Optional[Callable[[str], None]] = None
@@ -47,6 +92,81 @@ class ChatBox:
             "▼", 
             font_size=FONT_SIZE_SMALL
         )
+        
+        # Both toggle button labels, so toggling swaps surfaces instead of rendering
+        self._arrow_surfs = {
+            arrow: _render_text(self.toggle_button.font, arrow, self.toggle_button.text_color)
+            for arrow in ("▼", "▲")
+        }
+        
+        # Composed chat lines keyed by (sender, message)
+        self._render_cache: Dict[Tuple[str, str], pygame.Surface] = {}
+        
+        # Pre-composed background, border and input box, one per input active state
+        self._chrome_surfs = {active: self._build_chrome(active) for active in (False, True)}
+        
+        # Whole chat box as last drawn, redrawn only when marked dirty
+        self._composite = pygame.Surface((width, height)).convert()
+        self._dirty = True
+    
+    @property
+    def input_text(self) -> str:
+        """Text typed into the input box"""
+        return "".join(self._input_chars)
+    
+    @input_text.setter
+    def input_text(self, text: str) -> None:
+        self._input_chars: List[str] = list(text)
+        self._input_surf: Optional[pygame.Surface] = None  # Rendered on the next draw
+        self._dirty = True
+    
+    def _build_chrome(self, active: bool) -> pygame.Surface:
+        """
+        Draw the static chat box shapes onto a surface the size of the chat box
+        
+        Args:
+            active: Whether the input box is drawn in its active color
+            
+        Returns:
+            Surface to blit at the chat box's top-left corner
+        """
+        chrome = pygame.Surface(self.rect.size).convert()
+        local_rect = chrome.get_rect()
+        input_rect = self.input_rect.move(-self.rect.x, -self.rect.y)
+        
+        # Chat box background
+        pygame.draw.rect(chrome, (30, 30, 30), local_rect)
+        pygame.draw.rect(chrome, (60, 60, 60), local_rect, 1)
+        
+        # Input box
+        input_box_color = (60, 60, 100) if active else (40, 40, 60)
+        pygame.draw.rect(chrome, input_box_color, input_rect)
+        pygame.draw.rect(chrome, (100, 100, 130), input_rect, 1)
+        return chrome
+    
+    def _compose_line(self, sender: str, message: str) -> pygame.Surface:
+        """
+        Render a chat line with the sender name followed by the message text
+        
+        Args:
+            sender: Name of the message sender
+            message: Message text
+            
+        Returns:
+            Transparent surface holding the whole line
+        """
+        sender_text = _render_text(self.font, f"{sender}: ", (180, 180, 220))
+        message_text = _render_text(self.font, message)
+        sender_width = sender_text.get_width()
+        line = pygame.Surface((sender_width + message_text.get_width(),
+                               max(sender_text.get_height(), message_text.get_height())), pygame.SRCALPHA)
+        
+        # Transparent fills in each part's text color keep antialiased edges intact
+        line.fill((180, 180, 220, 0), (0, 0, sender_width, line.get_height()))
+        line.fill((*COLOR_TEXT, 0), (sender_width, 0, message_text.get_width(), line.get_height()))
+        line.blit(sender_text, (0, 0))
+        line.blit(message_text, (sender_width, 0))
+        return line.convert_alpha()
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -55,10 +175,15 @@ class ChatBox:
         Returns:
             True if event was handled by the chat box
         """
+        # Only clicks and key presses can change the chat box
+        if event.type not in _HANDLED_EVENT_TYPES:
+            return False
+        
         # Toggle chat visibility
         if event.type == pygame.MOUSEBUTTONDOWN and self.toggle_button.is_clicked(event.pos):
             self.hide_chat = not self.hide_chat
-            self.toggle_button.update_text("▼" if self.hide_chat else "▲")
+            arrow = "▼" if self.hide_chat else "▲"
+            self.toggle_button.set_label(arrow, self._arrow_surfs[arrow])
             return True
             
         if self.hide_chat:
@@ -68,9 +193,11 @@ class ChatBox:
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.input_rect.collidepoint(event.pos):
                 self.active = True
+                self._dirty = True
                 return True
-            else:
+            elif self.active:
                 self.active = False
+                self._dirty = True
                 
             # Check if send button was clicked
             if self.send_button.is_clicked(event.pos):
@@ -81,9 +208,11 @@ class ChatBox:
             if self.rect.collidepoint(event.pos):
                 if event.button == 4:  # Scroll up
                     self.scroll_offset = max(0, self.scroll_offset - 1)
+                    self._dirty = True
                     return True
                 elif event.button == 5:  # Scroll down
                     self.scroll_offset = min(self.max_scroll, self.scroll_offset + 1)
+                    self._dirty = True
                     return True
         
         # Handle text input if box is active
@@ -93,15 +222,21 @@ class ChatBox:
                     self._send_message()
                     return True
                 elif event.key == pygame.K_BACKSPACE:
-                    self.input_text = self.input_text[:-1]
+                    if self._input_chars:
+                        self._input_chars.pop()
+                        self._input_surf = None
+                        self._dirty = True
                     return True
                 elif event.key == pygame.K_ESCAPE:
                     self.active = False
+                    self._dirty = True
                     return True
                 else:
                     # Limit text length to prevent overflow
-                    if len(self.input_text) < 50:
-                        self.input_text += event.unicode
+                    if event.unicode and len(self._input_chars) < 50:
+                        self._input_chars.append(event.unicode)
+                        self._input_surf = None
+                        self._dirty = True
                     return True
         
         return False
@@ -114,7 +249,7 @@ class ChatBox:
                 new_name = self.input_text[6:].strip()  # Extract the new name
                 if new_name:
                     # Add a system message indicating name change
-                    self.messages.append({
+                    self.append_message({
                         "sender": "System",
                         "message": f"You changed your name to '{new_name}'"
                     })
@@ -132,13 +267,34 @@ class ChatBox:
             self.send_button.update(mouse_pos)
         self.toggle_button.update(mouse_pos)
     
+    def append_message(self, message: Dict[str, str]):
+        """
+        Add a single chat message, keeping cached lines of earlier messages
+        
+        Args:
+            message: Dict with "sender" and "message" keys
+        """
+        self.messages.append(message)
+        self.max_scroll = max(0, len(self.messages) - MAX_VISIBLE_MESSAGES)
+        # Auto-scroll to bottom if already at bottom
+        if self.scroll_offset >= self.max_scroll - 1:
+            self.scroll_offset = self.max_scroll
+        self._dirty = True
+    
     def set_messages(self, messages: List[Dict[str, str]]):
-        """Set chat messages"""
+        """Replace all chat messages (prefer append_message for new messages)"""
         self.messages = messages
+        
+        # Drop rendered surfaces of messages that are gone
+        keys = {(message['sender'], message['message']) for message in messages}
+        for key in [key for key in self._render_cache if key not in keys]:
+            del self._render_cache[key]
+        
         self.max_scroll = max(0, len(self.messages) - MAX_VISIBLE_MESSAGES)
         # Auto-scroll to bottom if already at bottom
         if self.scroll_offset == self.max_scroll - 1 or self.scroll_offset == self.max_scroll:
             self.scroll_offset = self.max_scroll
+        self._dirty = True
     
     def draw(self, surface: pygame.Surface):
         """Draw chat box on surface"""
@@ -148,61 +304,85 @@ class ChatBox:
         if self.hide_chat:
             return
             
-        # Draw chat box background
-        pygame.draw.rect(surface, (30, 30, 30), self.rect)
-        pygame.draw.rect(surface, (60, 60, 60), self.rect, 1)
+        # Redraw the chat box only after something in it changed
+        if self._dirty:
+            self._draw_composite()
+            self._dirty = False
+        surface.blit(self._composite, self.rect.topleft)
+        
+        # Draw send button on top, since its hover state changes independently
+        self.send_button.draw(surface)
+    
+    def _draw_composite(self):
+        """Draw the chat box, except the buttons, onto the composite surface"""
+        composite = self._composite
+        
+        # Draw chat box background and input box in one blit
+        composite.blit(self._chrome_surfs[self.active], (0, 0))
         
         # Draw messages
-        visible_messages = self.messages[max(0, len(self.messages) - MAX_VISIBLE_MESSAGES - self.scroll_offset):
-                                        len(self.messages) - self.scroll_offset]
+        count = len(self.messages)
+        start = max(0, count - MAX_VISIBLE_MESSAGES - self.scroll_offset)
+        end = count - self.scroll_offset
         
-        for i, message in enumerate(visible_messages):
-            y_pos = self.rect.y + 5 + i * CHAT_MESSAGE_HEIGHT
+        for i in range(end - start):
+            message = self.messages[start + i]
+            y_pos = 5 + i * CHAT_MESSAGE_HEIGHT
             
-            # Draw sender name
-            sender_text = self.font.render(f"{message['sender']}: ", True, (180, 180, 220))
-            surface.blit(sender_text, (self.rect.x + 5, y_pos))
+            # Compose sender name and message text into one line, once per message
+            key = (message['sender'], message['message'])
+            line = self._render_cache.get(key)
+            if line is None:
+                line = self._compose_line(message['sender'], message['message'])
+                self._render_cache[key] = line
             
-            # Draw message text
-            message_text = self.font.render(message['message'], True, COLOR_TEXT)
-            surface.blit(message_text, (self.rect.x + 5 + sender_text.get_width(), y_pos))
+            # Draw the line
+            composite.blit(line, (5, y_pos))
         
-        # Draw input box
-        input_box_color = (60, 60, 100) if self.active else (40, 40, 60)
-        pygame.draw.rect(surface, input_box_color, self.input_rect)
-        pygame.draw.rect(surface, (100, 100, 130), self.input_rect, 1)
-        
-        # Draw input text
-        input_surface = self.font.render(self.input_text, True, COLOR_TEXT)
-        surface.blit(input_surface, (self.input_rect.x + 5, self.input_rect.y + 5))
-        
-        # Draw send button
-        self.send_button.draw(surface)
+        # Draw input text, rendered again only after it was edited
+        if self._input_surf is None:
+            self._input_surf = _render_text(self.font, self.input_text)
+        input_rect = self.input_rect.move(-self.rect.x, -self.rect.y)
+        composite.blit(self._input_surf, (input_rect.x + 5, input_rect.y + 5))
         
         # Draw scroll indicators if needed
         if self.max_scroll > 0:
+            right = self.rect.width
             pygame.draw.polygon(
-                surface, 
+                composite, 
                 (200, 200, 200) if self.scroll_offset > 0 else (100, 100, 100),
-                [(self.rect.right - 15, self.rect.y + 10), 
-                 (self.rect.right - 5, self.rect.y + 10), 
-                 (self.rect.right - 10, self.rect.y + 5)]
+                [(right - 15, 10), 
+                 (right - 5, 10), 
+                 (right - 10, 5)]
             )
             pygame.draw.polygon(
-                surface, 
+                composite, 
                 (200, 200, 200) if self.scroll_offset < self.max_scroll else (100, 100, 100),
-                [(self.rect.right - 15, self.rect.y + CHAT_HEIGHT - 40), 
-                 (self.rect.right - 5, self.rect.y + CHAT_HEIGHT - 40), 
-                 (self.rect.right - 10, self.rect.y + CHAT_HEIGHT - 35)]
+                [(right - 15, CHAT_HEIGHT - 40), 
+                 (right - 5, CHAT_HEIGHT - 40), 
+                 (right - 10, CHAT_HEIGHT - 35)]
             )
 
 class MatchmakingScreen:
     """Matchmaking screen UI for finding online opponents"""
     
     def __init__(self):
-        self.font_large = pygame.font.SysFont("Arial", FONT_SIZE_LARGE)
-        self.font_medium = pygame.font.SysFont("Arial", FONT_SIZE_MEDIUM)
-        self.font_small = pygame.font.SysFont("Arial", FONT_SIZE_SMALL)
+        self.font_large = _get_font("Arial", FONT_SIZE_LARGE)
+        self.font_medium = _get_font("Arial", FONT_SIZE_MEDIUM)
+        self.font_small = _get_font("Arial", FONT_SIZE_SMALL)
+        
+        # Static labels, rendered once and centered horizontally
+        self._title_surf = _render_text(self.font_large, "Online Multiplayer")
+        self._title_pos = (WINDOW_WIDTH // 2 - self._title_surf.get_width() // 2, 80)
+        self._name_label_surf = _render_text(self.font_medium, "Your Name:")
+        self._name_label_pos = (WINDOW_WIDTH // 2 - self._name_label_surf.get_width() // 2, 170)
+        self._searching_surf = _render_text(self.font_medium, "Searching for opponent...")
+        self._searching_w = self._searching_surf.get_width()
+        self._searching_pos = (WINDOW_WIDTH // 2 - self._searching_w // 2, 250)
+        
+        # Animated dots after the searching text, indexed by dot count
+        self._dots_surfs = [_render_text(self.font_medium, "." * i) for i in range(4)]
+        self._dots_pos = (WINDOW_WIDTH // 2 + self._searching_w // 2, 250)
         
         # Create buttons
         self.back_button = Button(20, 20, 100, 40, "Back", font_size=FONT_SIZE_SMALL)
@@ -210,7 +390,7 @@ class MatchmakingScreen:
         # Player name input
         self.name_input_rect = pygame.Rect(WINDOW_WIDTH // 2 - 100, 200, 200, 30)
         self.name_input_active = False
-        self.player_name = "Player"
+        self.player_name = "Player"  # Stored as a list of characters, see the player_name property
         
         # Find game button
         self.find_game_button = Button(
@@ -227,6 +407,16 @@ class MatchmakingScreen:
         self.search_start_time = 0
         self.connecting = False
         
+    @property
+    def player_name(self) -> str:
+        """Name typed into the name input box"""
+        return "".join(self._name_chars)
+    
+    @player_name.setter
+    def player_name(self, name: str) -> None:
+        self._name_chars: List[str] = list(name)
+        self._name_surf: Optional[pygame.Surface] = None  # Rendered on the next draw
+        
     def handle_event(self, event: pygame.event.Event) -> Dict[str, Any]:
         """
         Handle matchmaking screen events
@@ -234,6 +424,10 @@ class MatchmakingScreen:
         Returns:
             Dict with action information or empty dict if no action
         """
+        # Only clicks and key presses can change the screen
+        if event.type not in _HANDLED_EVENT_TYPES:
+            return {}
+        
         result = {}
         
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -258,18 +452,23 @@ class MatchmakingScreen:
             if event.key == pygame.K_RETURN:
                 self.name_input_active = False
             elif event.key == pygame.K_BACKSPACE:
-                self.player_name = self.player_name[:-1]
+                if self._name_chars:
+                    self._name_chars.pop()
+                    self._name_surf = None
             else:
                 # Limit name length
-                if len(self.player_name) < 15:
-                    self.player_name += event.unicode
+                if event.unicode and len(self._name_chars) < 15:
+                    self._name_chars.append(event.unicode)
+                    self._name_surf = None
         
         return result
     
     def update(self, mouse_pos: Tuple[int, int]):
         """Update matchmaking screen state"""
         self.back_button.update(mouse_pos)
-        self.find_game_button.update(mouse_pos)
+        # The find game button is hidden while searching
+        if not self.searching:
+            self.find_game_button.update(mouse_pos)
     
     def draw(self, surface: pygame.Surface):
         """Draw matchmaking screen"""
@@ -277,21 +476,20 @@ class MatchmakingScreen:
         surface.fill(COLOR_BACKGROUND)
         
         # Draw title
-        title_text = self.font_large.render("Online Multiplayer", True, COLOR_TEXT)
-        surface.blit(title_text, (WINDOW_WIDTH // 2 - title_text.get_width() // 2, 80))
+        surface.blit(self._title_surf, self._title_pos)
         
         # Draw player name label
-        name_label = self.font_medium.render("Your Name:", True, COLOR_TEXT)
-        surface.blit(name_label, (WINDOW_WIDTH // 2 - name_label.get_width() // 2, 170))
+        surface.blit(self._name_label_surf, self._name_label_pos)
         
         # Draw name input box
         name_input_color = (60, 60, 100) if self.name_input_active else (40, 40, 60)
         pygame.draw.rect(surface, name_input_color, self.name_input_rect)
         pygame.draw.rect(surface, (100, 100, 130), self.name_input_rect, 1)
         
-        # Draw player name text
-        name_text = self.font_medium.render(self.player_name, True, COLOR_TEXT)
-        surface.blit(name_text, (self.name_input_rect.x + 5, self.name_input_rect.y + 5))
+        # Draw player name text, rendered again only after it was edited
+        if self._name_surf is None:
+            self._name_surf = _render_text(self.font_medium, self.player_name)
+        surface.blit(self._name_surf, (self.name_input_rect.x + 5, self.name_input_rect.y + 5))
         
         # Draw find game button if not searching
         if not self.searching:
@@ -306,36 +504,35 @@ class MatchmakingScreen:
     def draw_searching_animation(self, surface: pygame.Surface):
         """Draw the searching for opponent animation"""
         # Draw "Searching for opponent" text
-        searching_text = self.font_medium.render("Searching for opponent...", True, COLOR_TEXT)
-        surface.blit(searching_text, (WINDOW_WIDTH // 2 - searching_text.get_width() // 2, 250))
+        surface.blit(self._searching_surf, self._searching_pos)
+        
+        # Time since the search started, shared by the dots and the knight
+        elapsed = time.time() - self.search_start_time
         
         # Draw animated dots
-        dots = "." * (1 + int((time.time() - self.search_start_time) * 2) % 3)
-        dots_text = self.font_medium.render(dots, True, COLOR_TEXT)
-        surface.blit(dots_text, (WINDOW_WIDTH // 2 + searching_text.get_width() // 2, 250))
+        dots_count = 1 + int(elapsed * 2) % 3
+        surface.blit(self._dots_surfs[dots_count], self._dots_pos)
         
         # Draw spinning chess piece
-        self.draw_spinning_piece(surface, WINDOW_WIDTH // 2, 330)
+        self.draw_spinning_piece(surface, WINDOW_WIDTH // 2, 330, elapsed)
         
-    def draw_spinning_piece(self, surface: pygame.Surface, x: int, y: int):
+    def draw_spinning_piece(self, surface: pygame.Surface, x: int, y: int, elapsed: Optional[float] = None):
         """Draw spinning knight chess piece animation"""
-        # Calculate rotation based on time
-        angle = (time.time() - self.search_start_time) * 180 % 360
+        if elapsed is None:
+            elapsed = time.time() - self.search_start_time
+        
+        # Calculate rotation based on time, in whole degrees
+        angle = int(elapsed * 180) % 360
         
         # Draw the knight shape
-        radius = 30
+        radius = KNIGHT_RADIUS
         color = (220, 220, 220)
         
         # Draw a circular base
         pygame.draw.circle(surface, (80, 80, 80), (x, y), radius)
         
-        # Calculate knight points based on angle
-        knight_points = []
-        for i in range(8):
-            point_angle = angle + i * 45
-            point_x = x + int(math.cos(math.radians(point_angle)) * radius * 0.8)
-            point_y = y + int(math.sin(math.radians(point_angle)) * radius * 0.8)
-            knight_points.append((point_x, point_y))
+        # Look up knight points for the angle
+        knight_points = [(x + dx, y + dy) for dx, dy in _KNIGHT_OFFSETS[angle]]
         
         # Draw knight silhouette
         pygame.draw.polygon(surface, color, knight_points)
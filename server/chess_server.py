@@ -3,42 +3,139 @@ Chess game server for online multiplayer functionality.
 Handles WebSocket connections, matchmaking, and game state synchronization.
 """
 import asyncio
+import collections
 import json
 import uuid
-import random
+from time import monotonic
 import chess
-from typing import Dict, List, Set, Optional, Any
+from typing import Deque, Dict, List, Set, FrozenSet, Optional, Tuple, Union, Any
 import websockets
-from websockets.legacy.server import WebSocketServerProtocol  # Updated import
+from websockets.asyncio.server import serve, ServerConnection  # websockets>=14, see requirements.txt
+
+# orjson is optional (listed commented out in requirements.txt), fall back to the standard library encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Game states
 WAITING_FOR_OPPONENT = "waiting_for_opponent"
 GAME_IN_PROGRESS = "game_in_progress"
 GAME_OVER = "game_over"
 
+# Outbound messages buffered per connection before a client is treated as too slow
+OUTBOUND_QUEUE_SIZE = 256
+
+# Seconds a disconnected player can reconnect and resume their game
+RECONNECT_GRACE_PERIOD = 30
+
+# Chat messages kept per game and included in the game state
+CHAT_HISTORY_SIZE = 10
+
+def encode_message(data: Dict[str, Any]) -> Union[bytes, str]:
+    """Serialize an outgoing message to JSON, as UTF-8 bytes when orjson is available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data)
+
+def decode_message(message: Union[bytes, str]) -> Any:
+    """Parse an incoming JSON message, with orjson when it is available"""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same error either way
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
 class Player:
     """Player representation in the server"""
-    def __init__(self, websocket: WebSocketServerProtocol, player_id: str):
+    __slots__ = ("websocket", "player_id", "game_id", "ready", "name", "color", "out_queue", "writer_task", "closing")
+
+    def __init__(self, websocket: ServerConnection, player_id: str):
         self.websocket = websocket
         self.player_id = player_id
         self.game_id: Optional[str] = None
         self.ready = False
         self.name = f"Player_{player_id[:6]}"  # Default name
         self.color: Optional[chess.Color] = None
+        self.out_queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)  # Encoded outbound messages
+        self.writer_task: Optional[asyncio.Task] = None  # Drains out_queue to the websocket
+        self.closing = False  # Set once a close has been scheduled for a slow connection
 
 class Game:
     """Game representation in the server"""
+    __slots__ = ("game_id", "white_player", "black_player", "board", "state", "chat_history", "last_move",
+                 "turn_start_time", "white_time", "black_time", "_legal_moves_cache", "_legal_set_cache",
+                 "_legal_uci_cache", "_position_cache", "_state_cache")
+
     def __init__(self, game_id: str, white_player: Player, black_player: Player):
         self.game_id = game_id
         self.white_player = white_player
         self.black_player = black_player
         self.board = chess.Board()
         self.state = GAME_IN_PROGRESS
-        self.chat_history: List[Dict[str, str]] = []
+        self.chat_history: Deque[Dict[str, Any]] = collections.deque(maxlen=CHAT_HISTORY_SIZE)
         self.last_move: Optional[str] = None
-        self.turn_start_time = asyncio.get_event_loop().time()
+        self.turn_start_time = monotonic()
         self.white_time = None  # Placeholder for white's remaining time
         self.black_time = None  # Placeholder for black's remaining time
+        # Per-position caches, cleared by push_move
+        self._legal_moves_cache: Optional[List[chess.Move]] = None
+        self._legal_set_cache: Optional[FrozenSet[chess.Move]] = None
+        self._legal_uci_cache: Optional[List[str]] = None
+        self._position_cache: Optional[Dict[str, Any]] = None
+        # Encoded game_state messages by player_id, with the (state, opponent name) they were built for
+        self._state_cache: Dict[str, Tuple[Tuple[str, str], Union[bytes, str]]] = {}
+
+    def push_move(self, move: chess.Move):
+        """Play a move on the board and drop the caches for the old position"""
+        self.board.push(move)
+        self._legal_moves_cache = None
+        self._legal_set_cache = None
+        self._legal_uci_cache = None
+        self._position_cache = None
+        self._state_cache.clear()
+
+    def add_chat_message(self, chat_message: Dict[str, Any]):
+        """Record a chat message, dropping the encoded states that no longer show all of the chat"""
+        self.chat_history.append(chat_message)
+        self._state_cache.clear()
+
+    def _legal_moves(self) -> List[chess.Move]:
+        """Generate the legal moves of the current position once"""
+        if self._legal_moves_cache is None:
+            self._legal_moves_cache = list(self.board.legal_moves)
+        return self._legal_moves_cache
+
+    def legal_moves_set(self) -> FrozenSet[chess.Move]:
+        """Get the legal moves of the current position for membership checks"""
+        if self._legal_set_cache is None:
+            self._legal_set_cache = frozenset(self._legal_moves())
+        return self._legal_set_cache
+
+    def legal_moves_uci(self) -> List[str]:
+        """Get the legal moves of the current position in UCI notation"""
+        if self._legal_uci_cache is None:
+            self._legal_uci_cache = [move.uci() for move in self._legal_moves()]
+        return self._legal_uci_cache
+
+    def position_info(self) -> Dict[str, Any]:
+        """Get the FEN, outcome and check/game-over flags of the current position"""
+        if self._position_cache is None:
+            board = self.board
+            # One rules check for every flag; outcome() is None while the game goes on
+            outcome = board.outcome()
+            termination = outcome.termination if outcome else None
+            insufficient = termination == chess.Termination.INSUFFICIENT_MATERIAL
+            self._position_cache = {
+                "board_fen": board.fen(),
+                "outcome": outcome,
+                "is_check": board.is_check(),
+                "is_checkmate": termination == chess.Termination.CHECKMATE,
+                # outcome() reports insufficient material ahead of stalemate, so check that case directly
+                "is_stalemate": termination == chess.Termination.STALEMATE or (insufficient and board.is_stalemate()),
+                "is_insufficient_material": insufficient,
+                "is_game_over": outcome is not None
+            }
+        return self._position_cache
 
     def deduct_time(self):
         """Deduct time from the current player's clock (placeholder)"""
@@ -66,6 +163,10 @@ class Game:
             return self.white_player
         return None
     
+    def player_pairs(self) -> Tuple[Tuple[Player, Player], Tuple[Player, Player]]:
+        """Get (player, opponent) for white then black, for sending to both players"""
+        return ((self.white_player, self.black_player), (self.black_player, self.white_player))
+
     def is_player_turn(self, player_id: str) -> bool:
         """Check if it's the player's turn"""
         is_white_turn = self.board.turn == chess.WHITE
@@ -80,25 +181,56 @@ class Game:
         if not player or not opponent:
             return {"error": "Player not found in game"}
         
+        return self._personalize(self._get_shared_state(), player, opponent)
+
+    def get_state_message(self, for_player_id: str) -> Union[bytes, str]:
+        """Get the encoded game_state message for a player, reusing it until the game changes"""
+        player = self.get_player_by_id(for_player_id)
+        opponent = self.get_opponent(for_player_id)
+        
+        if not player or not opponent:
+            return encode_message({"type": "game_state", "game_state": {"error": "Player not found in game"}})
+        
+        # Moves and chat clear the cache; the key covers the game state and renames
+        key = (self.state, opponent.name)
+        cached = self._state_cache.get(for_player_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        message = encode_message({
+            "type": "game_state",
+            "game_state": self._personalize(self._get_shared_state(), player, opponent)
+        })
+        self._state_cache[for_player_id] = (key, message)
+        return message
+
+    def _get_shared_state(self) -> Dict[str, Any]:
+        """Get the part of the game state that is the same for both players"""
+        info = self.position_info()
         return {
             "game_id": self.game_id,
-            "board_fen": self.board.fen(),
-            "your_color": "white" if player.color == chess.WHITE else "black",
-            "your_turn": self.is_player_turn(for_player_id),
-            "opponent_name": opponent.name,
+            "board_fen": info["board_fen"],
             "state": self.state,
             "last_move": self.last_move,
-            "legal_moves": [move.uci() for move in self.board.legal_moves],
-            "chat_history": self.chat_history[-10:],  # Return last 10 messages
-            "is_check": self.board.is_check(),
-            "is_checkmate": self.board.is_checkmate(),
-            "is_stalemate": self.board.is_stalemate(),
-            "is_insufficient_material": self.board.is_insufficient_material(),
-            "is_game_over": self.board.is_game_over(),
+            "legal_moves": self.legal_moves_uci(),
+            "chat_history": list(self.chat_history),  # Only the last CHAT_HISTORY_SIZE messages are kept
+            "is_check": info["is_check"],
+            "is_checkmate": info["is_checkmate"],
+            "is_stalemate": info["is_stalemate"],
+            "is_insufficient_material": info["is_insufficient_material"],
+            "is_game_over": info["is_game_over"],
             "white_time": self.white_time,  # Placeholder for white's remaining time
             "black_time": self.black_time   # Placeholder for black's remaining time
         }
 
+    def _personalize(self, shared: Dict[str, Any], player: Player, opponent: Player) -> Dict[str, Any]:
+        """Add a player's own fields to a shared game state"""
+        game_state = dict(shared)
+        game_state["your_color"] = "white" if player.color == chess.WHITE else "black"
+        game_state["your_turn"] = self.board.turn == player.color
+        game_state["opponent_name"] = opponent.name
+        return game_state
+
 class ChessServer:
     """Chess server managing WebSocket connections and games"""
     def __init__(self, host: str = "localhost", port: int = 8765):
@@ -107,17 +239,26 @@ class ChessServer:
         self.players: Dict[str, Player] = {}  # player_id -> Player
         self.games: Dict[str, Game] = {}  # game_id -> Game
         self.waiting_players: Set[str] = set()  # Set of player_ids waiting for a match
+        # Arrival order of waiting players, holding exactly the ids in waiting_players
+        self.waiting_queue: Deque[str] = collections.deque()
+        # Disconnected players by player_id, with the timer that expires their reconnect window
+        self.reconnect_tokens: Dict[str, Tuple[Player, asyncio.TimerHandle]] = {}
+        self._game_counter = 0  # Games created, used to alternate colour assignment
+        # Fire-and-forget tasks, referenced here so they are not garbage collected mid-run
+        self._background_tasks: Set[asyncio.Task] = set()
         self.server = None  # Store server instance for shutdown
         
     async def start(self):
         """Start the WebSocket server"""
         print(f"Starting Chess Server on {self.host}:{self.port}")
-        self.server = await websockets.serve(
+        self.server = await serve(
             self.handle_connection,
             self.host,
             self.port,
             ping_interval=30,  # Send pings every 30 seconds
-            ping_timeout=60    # Allow 60 seconds for a pong response
+            ping_timeout=60,   # Allow 60 seconds for a pong response
+            # Messages are small JSON blobs: zlib costs more CPU than the bandwidth it saves
+            compression=None
         )
         try:
             await asyncio.Future()  # Run forever
@@ -127,29 +268,47 @@ class ChessServer:
             self.server.close()
             await self.server.wait_closed()
     
-    async def handle_connection(self, websocket: WebSocketServerProtocol):
+    async def handle_connection(self, websocket: ServerConnection):
         """Handle a new WebSocket connection"""
         player_id = None  # Initialize player_id to avoid UnboundLocalError
         try:
-            # Retrieve headers using the correct method
-            headers = websocket.request_headers if hasattr(websocket, "request_headers") else {}
-            player_id = headers.get("Player-ID")  # Check for existing player ID
+            # Retrieve headers from the handshake request
+            player_id = websocket.request.headers.get("Player-ID")  # Check for existing player ID
             
-            if player_id and player_id in self.players:
-                # Reconnecting player
-                player = self.players[player_id]
+            if player_id and player_id in self.reconnect_tokens:
+                # Reconnecting player, within the grace period
+                player, expiry = self.reconnect_tokens.pop(player_id)
+                expiry.cancel()
+                self.players[player_id] = player
                 player.websocket = websocket
-                await self.send_message(websocket, {
+                # Drop anything queued for the old connection; the reconnected message carries the full state
+                player.out_queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+                player.closing = False
+                self.start_writer(player)
+                game = self.games.get(player.game_id) if player.game_id else None
+                if not game:
+                    player.game_id = None
+                    player.color = None
+                await self.send_message(player, {
                     "type": "reconnected",
                     "player_id": player_id,
-                    "game_state": self.games[player.game_id].get_game_state(player_id) if player.game_id else None
+                    "game_state": game.get_game_state(player_id) if game else None
                 })
+                
+                # Let the opponent know the game is live again
+                opponent = game.get_opponent(player_id) if game else None
+                if opponent:
+                    await self.send_message(opponent, {
+                        "type": "opponent_reconnected",
+                        "opponent_name": player.name
+                    })
             else:
                 # New player
                 player_id = str(uuid.uuid4())
                 player = Player(websocket, player_id)
                 self.players[player_id] = player
-                await self.send_message(websocket, {
+                self.start_writer(player)
+                await self.send_message(player, {
                     "type": "connection_established",
                     "player_id": player_id
                 })
@@ -167,13 +326,14 @@ class ChessServer:
             print("Closing connection with client...")
             # Ensure the WebSocket connection is closed properly
             await websocket.close()
-            if player_id and player_id in self.players:
+            # Skip the cleanup if the player has already reconnected on another connection
+            if player_id and player_id in self.players and self.players[player_id].websocket is websocket:
                 await self.handle_disconnect(self.players[player_id])
     
-    async def process_message(self, player: Player, message: str):
+    async def process_message(self, player: Player, message: Union[bytes, str]):
         """Process incoming WebSocket messages"""
         try:
-            data = json.loads(message)
+            data = decode_message(message)
             message_type = data.get("type")
             
             if message_type == "find_game":
@@ -189,16 +349,15 @@ class ChessServer:
             elif message_type == "request_game_state":
                 await self.handle_request_game_state(player)
         except json.JSONDecodeError:
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Invalid JSON message"
             })
     
     async def handle_find_game(self, player: Player, data: Dict[str, Any]):
         """Handle request to find a game"""
-        # Remove from waiting list if already there
-        if player.player_id in self.waiting_players:
-            self.waiting_players.remove(player.player_id)
+        # Remove from waiting list if already there, so a repeat request goes to the back
+        self.remove_waiting_player(player.player_id)
         
         # Leave current game if in one
         if player.game_id and player.game_id in self.games:
@@ -206,12 +365,13 @@ class ChessServer:
         
         # Add player to waiting list
         self.waiting_players.add(player.player_id)
+        self.waiting_queue.append(player.player_id)
         
         # Update player name if provided
         if "player_name" in data:
             player.name = data["player_name"][:20]  # Limit name length
         
-        await self.send_message(player.websocket, {
+        await self.send_message(player, {
             "type": "matchmaking", 
             "status": WAITING_FOR_OPPONENT
         })
@@ -222,9 +382,9 @@ class ChessServer:
     async def try_matchmaking(self):
         """Try to match waiting players"""
         if len(self.waiting_players) >= 2:
-            # Get two players from the waiting list
-            player1_id = self.waiting_players.pop()
-            player2_id = self.waiting_players.pop()
+            # Get the two longest waiting players
+            player1_id = self.pop_waiting_player()
+            player2_id = self.pop_waiting_player()
             
             player1 = self.players[player1_id]
             player2 = self.players[player2_id]
@@ -232,8 +392,9 @@ class ChessServer:
             # Create a new game
             game_id = str(uuid.uuid4())
             
-            # Randomly assign colors
-            if random.choice([True, False]):
+            # Alternate which of the pair gets white from one game to the next
+            self._game_counter += 1
+            if self._game_counter & 1:
                 white_player, black_player = player1, player2
             else:
                 white_player, black_player = player2, player1
@@ -248,22 +409,35 @@ class ChessServer:
             white_player.game_id = game_id
             black_player.game_id = game_id
             
-            # Notify players about the game
-            for player in [white_player, black_player]:
-                opponent = game.get_opponent(player.player_id)
-                await self.send_message(player.websocket, {
+            # Notify players about the game, sharing the common state
+            shared = game._get_shared_state()
+            for player, opponent in game.player_pairs():
+                await self.send_message(player, {
                     "type": "game_start",
                     "game_id": game_id,
                     "your_color": "white" if player.color == chess.WHITE else "black",
-                    "opponent_name": opponent.name if opponent else "Unknown",
-                    "game_state": game.get_game_state(player.player_id)
+                    "opponent_name": opponent.name,
+                    "game_state": game._personalize(shared, player, opponent)
                 })
     
+    def pop_waiting_player(self) -> str:
+        """Remove and return the player who has been waiting longest"""
+        player_id = self.waiting_queue.popleft()
+        self.waiting_players.remove(player_id)
+        return player_id
+    
+    def remove_waiting_player(self, player_id: str):
+        """Take a player out of the waiting list, if they are in it"""
+        # The set check keeps the O(n) deque removal off the common not-waiting path
+        if player_id in self.waiting_players:
+            self.waiting_players.remove(player_id)
+            self.waiting_queue.remove(player_id)
+    
     async def handle_make_move(self, player: Player, data: Dict[str, Any]):
         """Handle player's move"""
         game_id = player.game_id
         if not game_id or game_id not in self.games:
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Not in a game"
             })
@@ -280,20 +454,19 @@ class ChessServer:
             game.state = GAME_OVER
             result = "1-0" if time_up == "white" else "0-1"
             reason = "time out"
-            for player_id in [game.white_player.player_id, game.black_player.player_id]:
-                player = game.get_player_by_id(player_id)
-                if player:
-                    await self.send_message(player.websocket, {
-                        "type": "game_over",
-                        "result": result,
-                        "reason": reason,
-                        "game_state": game.get_game_state(player_id)
-                    })
+            shared = game._get_shared_state()
+            for recipient, opponent in game.player_pairs():
+                await self.send_message(recipient, {
+                    "type": "game_over",
+                    "result": result,
+                    "reason": reason,
+                    "game_state": game._personalize(shared, recipient, opponent)
+                })
             return
 
         # Check if it's the player's turn
         if not game.is_player_turn(player.player_id):
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Not your turn"
             })
@@ -302,7 +475,7 @@ class ChessServer:
         # Parse the move
         move_uci = data.get("move")
         if not move_uci:
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Move not specified"
             })
@@ -310,70 +483,71 @@ class ChessServer:
             
         try:
             move = chess.Move.from_uci(move_uci)
-            if move not in game.board.legal_moves:
-                await self.send_message(player.websocket, {
+            if move not in game.legal_moves_set():
+                await self.send_message(player, {
                     "type": "error", 
                     "message": "Illegal move"
                 })
                 return
                 
             # Make the move
-            game.board.push(move)
+            game.push_move(move)
             game.last_move = move_uci
-            game.turn_start_time = asyncio.get_event_loop().time()
+            game.turn_start_time = monotonic()
+            info = game.position_info()
             
             # Check if game is over
-            if game.board.is_game_over():
+            if info["is_game_over"]:
                 game.state = GAME_OVER
                 
                 # Determine result
-                result = "1-0" if game.board.is_checkmate() and not game.board.turn else "0-1" if game.board.is_checkmate() else "1/2-1/2"
+                result = "1-0" if info["is_checkmate"] and not game.board.turn else "0-1" if info["is_checkmate"] else "1/2-1/2"
+                reason = self.get_game_over_reason(info)
                 
-                # Send game over notification to both players
-                for player_id in [game.white_player.player_id, game.black_player.player_id]:
-                    player = game.get_player_by_id(player_id)
-                    if player:
-                        await self.send_message(player.websocket, {
-                            "type": "game_over",
-                            "result": result,
-                            "reason": self.get_game_over_reason(game.board),
-                            "game_state": game.get_game_state(player_id)
-                        })
+                # Send game over notification to both players, sharing the common state
+                shared = game._get_shared_state()
+                for recipient, opponent in game.player_pairs():
+                    await self.send_message(recipient, {
+                        "type": "game_over",
+                        "result": result,
+                        "reason": reason,
+                        "game_state": game._personalize(shared, recipient, opponent)
+                    })
             else:
-                # Send updated game state to both players
-                for player_id in [game.white_player.player_id, game.black_player.player_id]:
-                    player = game.get_player_by_id(player_id)
-                    if player:
-                        await self.send_message(player.websocket, {
-                            "type": "move_made",
-                            "move": move_uci,
-                            "by_player": game.get_opponent(player_id).name if game.get_opponent(player_id) else "Opponent",
-                            "game_state": game.get_game_state(player_id)
-                        })
+                # Send updated game state to both players, sharing the common state
+                shared = game._get_shared_state()
+                for recipient, opponent in game.player_pairs():
+                    await self.send_message(recipient, {
+                        "type": "move_made",
+                        "move": move_uci,
+                        "by_player": opponent.name,
+                        "game_state": game._personalize(shared, recipient, opponent)
+                    })
                         
         except ValueError:
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Invalid move format"
             })
         except Exception as e:
             print(f"Unexpected error while processing move: {e}")
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error",
                 "message": "An unexpected error occurred while processing your move."
             })
             
-    def get_game_over_reason(self, board: chess.Board) -> str:
-        """Get human-readable reason for game end"""
-        if board.is_checkmate():
+    def get_game_over_reason(self, info: Dict[str, Any]) -> str:
+        """Get human-readable reason for game end from Game.position_info()"""
+        termination = info["outcome"].termination if info["outcome"] else None
+        if termination == chess.Termination.CHECKMATE:
             return "checkmate"
-        elif board.is_stalemate():
+        elif info["is_stalemate"]:
             return "stalemate"
-        elif board.is_insufficient_material():
+        elif termination == chess.Termination.INSUFFICIENT_MATERIAL:
             return "insufficient material"
-        elif board.is_fivefold_repetition():
+        elif termination == chess.Termination.FIVEFOLD_REPETITION:
             return "fivefold repetition"
-        elif board.is_seventyfive_moves():
+        elif termination == chess.Termination.SEVENTYFIVE_MOVES:
             return "seventyfive moves rule"
         return "game over"
         
@@ -392,26 +566,25 @@ class ChessServer:
         chat_message = {
             "sender": player.name,
             "message": message_text,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": monotonic()
         }
         
         # Add to chat history
-        game.chat_history.append(chat_message)
+        game.add_chat_message(chat_message)
         
-        # Send to both players
-        for player_id in [game.white_player.player_id, game.black_player.player_id]:
-            recv_player = game.get_player_by_id(player_id)
-            if recv_player:
-                await self.send_message(recv_player.websocket, {
-                    "type": "chat_message",
-                    "message": chat_message
-                })
+        # Send to both players, encoding the message once
+        self.broadcast_message(
+            [recv_player for recv_player in (game.white_player, game.black_player) if recv_player],
+            {
+                "type": "chat_message",
+                "message": chat_message
+            })
     
     async def handle_update_name(self, player: Player, data: Dict[str, Any]):
         """Handle player name update"""
         new_name = data.get("name", "").strip()
         if not new_name or len(new_name) > 20:  # Validate name
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Invalid name"
             })
@@ -424,12 +597,12 @@ class ChessServer:
             game = self.games[player.game_id]
             opponent = game.get_opponent(player.player_id)
             if opponent:
-                await self.send_message(opponent.websocket, {
+                await self.send_message(opponent, {
                     "type": "opponent_update",
                     "name": player.name
                 })
                 
-        await self.send_message(player.websocket, {
+        await self.send_message(player, {
             "type": "name_updated", 
             "name": player.name
         })
@@ -448,7 +621,7 @@ class ChessServer:
 
             # Notify opponent of resignation
             if opponent:
-                await self.send_message(opponent.websocket, {
+                await self.send_message(opponent, {
                     "type": "opponent_resigned",
                     "opponent_name": player.name
                 })
@@ -470,45 +643,112 @@ class ChessServer:
         """Send current game state to player"""
         game_id = player.game_id
         if not game_id or game_id not in self.games:
-            await self.send_message(player.websocket, {
+            await self.send_message(player, {
                 "type": "error", 
                 "message": "Not in a game"
             })
             return
             
         game = self.games[game_id]
-        await self.send_message(player.websocket, {
-            "type": "game_state",
-            "game_state": game.get_game_state(player.player_id)
-        })
+        self._enqueue(player, game.get_state_message(player.player_id))
         
     async def handle_disconnect(self, player: Player):
         """Handle player disconnection"""
         try:
             # Remove from waiting players if there
-            if player.player_id in self.waiting_players:
-                self.waiting_players.remove(player.player_id)
-
-            # If in a game, handle as resignation
-            if player.game_id:
-                await self.handle_resign(player)
+            self.remove_waiting_player(player.player_id)
 
             # Remove player
             if player.player_id in self.players:
                 del self.players[player.player_id]
+            
+            # Stop sending to the closed connection
+            if player.writer_task:
+                player.writer_task.cancel()
+                player.writer_task = None
+            
+            # Keep the player (and their game) for a grace period so they can reconnect
+            expiry = asyncio.get_running_loop().call_later(
+                RECONNECT_GRACE_PERIOD, self._expire_token, player.player_id)
+            self.reconnect_tokens[player.player_id] = (player, expiry)
+            
+            # Tell the opponent right away, rather than leaving them waiting for the resignation
+            game = self.games.get(player.game_id) if player.game_id else None
+            opponent = game.get_opponent(player.player_id) if game else None
+            if opponent:
+                await self.send_message(opponent, {
+                    "type": "opponent_disconnected",
+                    "opponent_name": player.name,
+                    "grace_period": RECONNECT_GRACE_PERIOD
+                })
         except KeyError as e:
             print(f"Error during disconnect cleanup: {e}")
         except Exception as e:
             print(f"Unexpected error during disconnect: {e}")
+    
+    def _expire_token(self, player_id: str):
+        """End a disconnected player's reconnect window, resigning their game if they had one"""
+        entry = self.reconnect_tokens.pop(player_id, None)
+        if entry is None:
+            return
+        player = entry[0]
+        if player.game_id:
+            self._spawn(self.handle_resign(player))
             
-    async def send_message(self, websocket: WebSocketServerProtocol, data: Dict[str, Any]):
-        """Send message to WebSocket client"""
+    def start_writer(self, player: Player):
+        """Start the task that sends a player's queued messages, unless one is already running"""
+        if player.writer_task is None or player.writer_task.done():
+            player.writer_task = asyncio.create_task(self._writer(player))
+
+    async def _writer(self, player: Player):
+        """Send queued messages to the player's current WebSocket, one at a time"""
+        while True:
+            message = await player.out_queue.get()
+            try:
+                # Always a text frame, even when orjson produced bytes
+                await player.websocket.send(message, text=True)
+            except websockets.exceptions.ConnectionClosed:
+                print("Failed to send message: Connection closed.")
+            except Exception as e:
+                print(f"Unexpected error while sending message: {e}")
+
+    def _enqueue(self, player: Player, message: Union[bytes, str]):
+        """Queue an encoded message for a player, closing the connection if the client is too slow"""
+        # A disconnected player has no writer; the reconnected message carries the full state instead
+        if player.writer_task is None:
+            return
         try:
-            await websocket.send(json.dumps(data))
-        except websockets.exceptions.ConnectionClosedError:
-            print("Failed to send message: Connection closed.")
-        except Exception as e:
-            print(f"Unexpected error while sending message: {e}")
+            player.out_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Only schedule one close, however many more messages arrive meanwhile
+            if player.closing:
+                return
+            player.closing = True
+            print(f"Closing connection to slow client {player.player_id}: outbound queue full")
+            self._spawn(player.websocket.close(1008, "Outbound queue full"))
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine as a tracked background task, reporting any error it raises"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+        return task
+
+    def _background_task_done(self, task: asyncio.Task):
+        """Drop a finished background task and print its error, if any"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Unexpected error in background task: {task.exception()}")
+
+    async def send_message(self, player: Player, data: Dict[str, Any]):
+        """Queue a message for a player's WebSocket client"""
+        self._enqueue(player, encode_message(data))
+
+    def broadcast_message(self, players: List[Player], data: Dict[str, Any]):
+        """Queue the same message for several players, serializing it once"""
+        message = encode_message(data)
+        for player in players:
+            self._enqueue(player, message)
 
 async def main():
     """Run the Chess server"""
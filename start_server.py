@@ -8,6 +8,12 @@ import sys
 import os
 from server.chess_server import ChessServer
 
+# uvloop is optional (listed commented out in requirements.txt, unavailable on windows), fall back to the stock asyncio loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 def print_banner():
     """prints a welcome banner for the server"""
     print("=" * 60)
@@ -43,6 +49,10 @@ async def main():
     await server.start()
 
 if __name__ == "__main__":
+    # run socket i/o on libuv when uvloop is installed
+    if uvloop is not None:
+        uvloop.install()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt: